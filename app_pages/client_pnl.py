@@ -0,0 +1,111 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from whalestreet import core
+from whalestreet.ledger import DEFAULT_PAGE_SIZE as CLIENTS_PER_PAGE, format_inr
+from whalestreet.theme import PRIMARY_COLOR, ACCENT_COLOR, SHADOW_COLOR, CHART_THEME
+
+PROFILER = core.profiler()
+figure_cache = core.get_figure_cache()
+ledger = core.get_ledger()
+
+def build_profit_trend(chart, theme):
+    fig = px.line(chart["data"], x='Month', y='Profit', title=chart["title"], markers=True)
+    fig.update_layout(title_font_size=18, title_x=0.5, plot_bgcolor=theme["background"], font=dict(color=theme["text"]))
+    return fig
+
+def build_total_return(aggregate_df, theme):
+    fig_return = px.bar(aggregate_df, x="Client", y="Total Return (%)", color="Time Period",
+                        title="Total Return Percentage by Client (Including Time Duration)",
+                        labels={"Total Return (%)": "Total Return (%)"},
+                        template="plotly_white")
+    fig_return.update_layout(plot_bgcolor=theme["background"], font=dict(color=theme["text"]))
+    return fig_return
+
+# Modern Header with an icon and background
+st.markdown(f'''
+    <div style="text-align: center; padding: 20px 0; background-color: {PRIMARY_COLOR}; border-radius: 10px; box-shadow: 2px 2px 5px {SHADOW_COLOR};">
+        <img src="https://img.icons8.com/ios-filled/50/ffffff/graph-report.png" width="50"/>
+        <h2 style="color: white; margin-top: 10px;">Client P&L Dashboard</h2>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown("""
+    ### Client Profit and Loss (P&L) Overview
+    This dashboard provides a detailed overview of the P&L results for our top clients, demonstrating the success and transparency of our portfolio management services.
+    """)
+
+# Performance Overview Section styled with borders and shadow
+st.markdown(f"""
+    <div class="section-header">
+        <h3>Performance Overview</h3>
+        The summary below reflects real past trends based on our clients' portfolios.
+    </div>
+    """, unsafe_allow_html=True)
+
+# Display fixed performance metrics with borders and shadow
+col1, col2, col3 = st.columns(3)
+col1.metric("Avg Initial Capital", "₹3,00,000", help="The initial investment made by the client.")
+col2.metric("Avg Annual Return", "34.78%", help="The average annual return generated.")
+col3.metric("Monthly Avg % Change", "2-4%", help="Average monthly return based on historical data.")
+
+# Clients are read from the ledger one page at a time
+client_count = ledger.client_count()
+page_count = max(1, -(-client_count // CLIENTS_PER_PAGE))
+page_number = 1
+if page_count > 1:
+    page_number = st.number_input(f"Client page (of {page_count})", min_value=1, max_value=page_count,
+                                  value=1, step=1)
+with PROFILER.section("ledger query"):
+    clients = ledger.clients(offset=(page_number - 1) * CLIENTS_PER_PAGE, limit=CLIENTS_PER_PAGE)
+
+# Tabs for each client's P&L; only the open tab queries and renders its client
+tabs = st.tabs(list(clients["name"]), key=f"client_tabs_{page_number}", on_change="rerun")
+
+for tab, (client_id, client) in zip(tabs, clients.iterrows()):
+    if not tab.open:
+        continue
+    with tab:
+        st.markdown(f'''
+            <div class="section-header">
+                <h3 style="color: {ACCENT_COLOR};">{client["name"]} P&L</h3>
+            </div>
+            ''', unsafe_allow_html=True)
+        if client["verified_url"]:
+            st.markdown(f"**Live Verified P&L:** [{client['name']} P&L Results]({client['verified_url']})")
+
+        with PROFILER.section("ledger query"):
+            pnl = ledger.monthly_pnl(client_id)
+        data = pd.DataFrame({
+            'Month': pnl['month'].dt.strftime('%b %Y'),
+            'Profit': pnl['profit']
+        })
+        with PROFILER.section("figure construction"):
+            fig = figure_cache.figure("profit_trend", build_profit_trend,
+                                      {"title": f"Monthly Profit Trend for {client['name']}", "data": data}, CHART_THEME)
+        with PROFILER.section("st.plotly_chart"):
+            st.plotly_chart(fig)
+
+st.markdown('<hr style="border: 1px solid #dddddd; margin: 30px 0;" />', unsafe_allow_html=True)
+
+# Aggregate Insights
+st.markdown("### Aggregate Insights")
+st.markdown("Analyze overall performance across clients using the aggregated insights below:")
+
+aggregate_df = pd.DataFrame({
+    "Client": clients["name"],
+    "Initial Capital": clients["initial_capital"].map(format_inr),
+    "Total Capital (After Profit)": clients["total_capital"].map(format_inr),
+    "Total Return (%)": clients["total_return"].round(2),
+    "Time Period": clients["period"]
+}).reset_index(drop=True)
+
+# Display the aggregated data in a table
+st.dataframe(aggregate_df)
+
+# Bar Chart for Total Returns with Time Duration
+with PROFILER.section("figure construction"):
+    fig_return = figure_cache.figure("total_return", build_total_return, aggregate_df, CHART_THEME)
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_return)
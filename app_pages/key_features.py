@@ -0,0 +1,64 @@
+import streamlit as st
+
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/color/48/000000/rocket.png" width="48"/>
+        <h2 style="color: #4A4A4A; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Key Features of Whalestreet PMS</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Discover the innovative features that set us apart in the world of portfolio management.</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Features Section with Enhanced Visuals
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/strategy-board.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">Tailored Portfolio Management</h3>
+            <p style="color: #555555;">We craft personalized portfolio strategies tailored to meet your unique financial goals and risk tolerance.</p>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/realtime-protection.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">Real-Time Monitoring & Alerts</h3>
+            <p style="color: #555555;">Get instant updates and alerts on your portfolio’s performance with our real-time monitoring tools.</p>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/artificial-intelligence.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">Machine Learning Models</h3>
+            <p style="color: #555555;">Our advanced machine learning models analyze market trends and predict future movements to optimize your portfolio.</p>
+        </div>
+        ''', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/shield.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">Advanced Risk Management</h3>
+            <p style="color: #555555;">Our comprehensive risk management strategies protect your investments from market volatility and unexpected events.</p>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/report-card.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">Transparent Reporting & Analytics</h3>
+            <p style="color: #555555;">We provide comprehensive and transparent reports, offering you clear insights into your portfolio’s performance.</p>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    st.markdown('''
+        <div style="background-color: #F0F4F8; padding: 30px; border-radius: 15px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); text-align: center;">
+            <img src="https://img.icons8.com/ios-filled/100/0A74DA/customer-support.png" width="100" style="margin-bottom: 20px;"/>
+            <h3 style="color: #1E2D39;">24/7 Client Support</h3>
+            <p style="color: #555555;">Our dedicated support team is available around the clock to assist you with any queries and provide expert guidance.</p>
+        </div>
+        ''', unsafe_allow_html=True)
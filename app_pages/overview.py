@@ -0,0 +1,130 @@
+import streamlit as st
+
+
+# Whalestreet Branding Header with Sleek Design
+st.markdown('''
+    <div style="background-color: #1E2D39; padding: 20px; border-radius: 10px;">
+        <h1 style="color: #FFFFFF; font-family: 'Arial', sans-serif; text-align: center;">Welcome to Whalestreet Portfolio Management</h1>
+        <p style="color: #CCCCCC; font-size: 16px; text-align: center;">Your Partner in Quantitative Investment Excellence</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Introduction Section with More Professional Visuals
+st.markdown('''
+    <div style="font-size: 16px; line-height: 1.8; color: #1E2D39; margin-bottom: 20px;">
+        At Whalestreet Portfolio Management, we offer advanced, data-driven portfolio management services designed to maximize your investment returns while minimizing risk. Our platform utilizes proprietary algorithms and quantitative models to deliver superior results.
+        <br><br>
+        As an official partner of <strong>AngelOne Broking</strong> and backed by the esteemed <strong>Delhi Technological University (DTU)</strong>, we are poised to become the leading quant and portfolio management service provider, offering comprehensive services to our clients.
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Performance Metrics Section (Graphs)
+st.markdown('''
+    <div style="font-size: 18px; color: #1E2D39; text-align: center; margin-bottom: 20px;">
+        <strong>Explore Our Performance Metrics</strong>
+    </div>
+    ''', unsafe_allow_html=True)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("#### Portfolio Growth Over Time", unsafe_allow_html=True)
+    # Simulated fluctuating data for portfolio growth graph
+    portfolio_growth = [100, 110, 90, 120, 95, 130, 125, 140, 135, 150]
+    st.line_chart(portfolio_growth)
+
+with col2:
+    st.markdown("#### Risk vs. Return", unsafe_allow_html=True)
+    # Simulated fluctuating data for risk vs. return scatter plot
+    data = {
+        'Risk': [5, 7, 10, 15, 18, 20, 22, 25, 28],
+        'Return': [2, 4, 6, 8, 10, 12, 14, 16, 18]
+    }
+    st.scatter_chart(data)
+
+# Client Testimonials and Trust Indicators
+st.markdown('''
+    ### What Our Clients Say
+    <div style="background-color: #F5F5F5; padding: 20px; border-radius: 8px; font-size: 16px; color: #1E2D39; margin-bottom: 20px;">
+        <blockquote style="font-style: italic;">
+            "Whalestreet has transformed my investment approach. Their data-driven strategies have consistently outperformed my expectations."
+            <br><strong>- Ayush</strong>
+        </blockquote>
+        <blockquote style="font-style: italic;">
+            "The transparency and personalized service at Whalestreet are unparalleled. I trust them with my financial future."
+            <br><strong>- Prakash</strong>
+        </blockquote>
+    </div>
+    ''', unsafe_allow_html=True)
+
+
+# Our Philosophy Section with Sleek Icons and Minimalistic Design
+st.markdown('''
+    ### Our Philosophy
+    <div style="background-color: #F5F5F5; padding: 20px; border-radius: 8px;">
+        <div style="display: flex; justify-content: space-between; text-align: center;">
+            <div style="width: 30%;">
+                <img src="https://img.icons8.com/ios-filled/50/0A74DA/medal.png" width="50" style="margin-bottom: 10px;"/>
+                <p><strong>Proven Expertise</strong></p>
+                <p style="font-size: 14px; color: #1E2D39;">Decades of experience in managing portfolios with consistent outperformance.</p>
+            </div>
+            <div style="width: 30%;">
+                <img src="https://img.icons8.com/ios-filled/50/0A74DA/visible.png" width="50" style="margin-bottom: 10px;"/>
+                <p><strong>Transparency</strong></p>
+                <p style="font-size: 14px; color: #1E2D39;">No hidden fees; upfront and clear pricing.</p>
+            </div>
+            <div style="width: 30%;">
+                <img src="https://img.icons8.com/ios-filled/50/0A74DA/artificial-intelligence.png" width="50" style="margin-bottom: 10px;"/>
+                <p><strong>Innovation</strong></p>
+                <p style="font-size: 14px; color: #1E2D39;">Advanced statistical models and AI-based tools for better returns.</p>
+            </div>
+        </div>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown('''
+### Why Choose Whalestreet?
+<div style="font-size: 16px; line-height: 1.6; margin-bottom: 20px;">
+    <div style="background-color: #1E2D39; padding: 15px; border-radius: 8px; color: #FFFFFF;">
+        <h4 style="color: #FFFFFF;">
+            <img src="https://img.icons8.com/color/20/FFFFFF/investment-portfolio.png" width="20" style="vertical-align: middle; margin-right: 8px;"/> 
+            Tailored Portfolio Management
+        </h4>
+        <p style="color: #CCCCCC;">Our portfolios are managed based on your specific risk profile, delivering personalized investment strategies.</p>
+    </div>
+    <div style="background-color: #E8E8E8; padding: 15px; border-radius: 8px; margin-top: 20px; color: #1E2D39;">
+        <h4>
+            <img src="https://img.icons8.com/color/20/1E2D39/task.png" width="20" style="vertical-align: middle; margin-right: 8px;"/> 
+            Diverse and Proven Strategies
+        </h4>
+        <p>We employ multi-asset strategies designed for growth, income, and balance, adapted to market dynamics.</p>
+    </div>
+    <div style="background-color: #1E2D39; padding: 15px; border-radius: 8px; margin-top: 20px; color: #FFFFFF;">
+        <h4 style="color: #FFFFFF;">
+            <img src="https://img.icons8.com/ios-filled/20/FFFFFF/line-chart.png" width="20" style="vertical-align: middle; margin-right: 8px;"/> 
+            Cutting-Edge Analytics
+        </h4>
+        <p style="color: #CCCCCC;">Leverage the latest AI and machine learning models to optimize performance and reduce risk exposure.</p>
+    </div>
+    <div style="background-color: #E8E8E8; padding: 15px; border-radius: 8px; margin-top: 20px; color: #1E2D39;">
+        <h4>
+            <img src="https://img.icons8.com/ios-filled/20/1E2D39/handshake.png" width="20" style="vertical-align: middle; margin-right: 8px;"/> 
+            Strategic Partnerships
+        </h4>
+        <p>With AngelOne Broking as our official partner and support from DTU, we offer the best resources in the market.</p>
+    </div>
+</div>
+''', unsafe_allow_html=True)
+
+# Case Studies and Success Stories
+st.markdown('''
+    ### Success Stories
+    <div style="background-color: #F5F5F5; padding: 20px; border-radius: 8px;">
+        <div style="font-size: 16px; color: #1E2D39; margin-bottom: 20px;">
+            <strong>Ajay:</strong> Increased portfolio value by 38% in one year through customized growth strategy.
+        </div>
+        <div style="font-size: 16px; color: #1E2D39;">
+            <strong>Mohit:</strong> Reduced portfolio risk by 15% while maintaining stable returns.
+        </div>
+    </div>
+    ''', unsafe_allow_html=True)
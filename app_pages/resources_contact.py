@@ -0,0 +1,31 @@
+import streamlit as st
+
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/contact-card.png" width="50" alt="Contact Icon"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Contact Information</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Reach Out to Us for Any Inquiries or Support</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Adding a visually appealing contact card layout
+st.markdown('''
+    <div style="background-color: #F7F7F7; padding: 30px; border-radius: 12px; box-shadow: 0px 4px 15px rgba(0, 0, 0, 0.1);">
+        <h3 style="color: #1E2D39; text-align: center; font-weight: bold;">Get in Touch</h3>
+        <p style="font-size: 16px; color: #333333; text-align: center;">We would love to hear from you! Reach out to us for any inquiries, support, or feedback.</p>
+        <div style="display: flex; justify-content: space-around; margin-top: 30px;">
+            <div style="width: 45%; text-align: center;">
+                <img src="https://img.icons8.com/ios-filled/100/007ACC/phone.png" width="50" alt="Phone Icon"/>
+                <p style="font-size: 18px; color: #007ACC; font-weight: bold;">Phone:</p>
+                <p style="font-size: 18px; color: #333333;">+91-8178611382</p>
+            </div>
+            <div style="width: 45%; text-align: center;">
+                <img src="https://img.icons8.com/ios-filled/100/007ACC/email.png" width="50" alt="Email Icon"/>
+                <p style="font-size: 18px; color: #007ACC; font-weight: bold;">Email:</p>
+                <p style="font-size: 18px; color: #333333;">whalestreetofficial@gmail.com</p>
+            </div>
+        </div>
+    </div>
+    ''', unsafe_allow_html=True)
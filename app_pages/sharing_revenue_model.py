@@ -0,0 +1,425 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from whalestreet import core, feegrid, fees, goalseek
+from whalestreet.core import compute_breakeven_curve, simulate_fee_bands
+from whalestreet.theme import CHART_THEME
+
+PROFILER = core.profiler()
+figure_cache = core.get_figure_cache()
+
+# Net capital per rupee invested across the fee grid, with the current inputs marked
+def build_sensitivity(chart, theme):
+    fig = go.Figure(go.Heatmap(
+        x=chart["returns"],
+        y=chart["capitals"],
+        z=chart["multiples"],
+        colorscale="RdYlGn",
+        zmid=1.0,
+        colorbar=dict(title="× Initial"),
+        hovertemplate="Initial capital: ₹%{y:,.0f}<br>Annual return: %{x:.0f}%<br>Net capital: %{z:.2f}× initial<extra></extra>"
+    ))
+    fig.update_layout(
+        title=chart["title"],
+        xaxis_title="Average Annual Return (%)",
+        yaxis_title="Initial Capital (₹)",
+        yaxis_type="log",
+        plot_bgcolor='#ffffff',
+        title_x=0.5,
+        font=dict(color='#333333'),
+        height=600
+    )
+    fig.add_trace(go.Scatter(
+        x=[chart["inputs"][0]],
+        y=[chart["inputs"][1]],
+        mode='markers',
+        name='Your inputs',
+        marker=dict(color='#1E2D39', size=12, symbol='x'),
+        hovertemplate="Your inputs<extra></extra>"
+    ))
+    return fig
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/money-bag.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Sharing Revenue Model</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Select the model that best fits your investment strategy</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Toggle for selecting the revenue model
+st.markdown("### Revenue Sharing Model")
+model_choice = st.radio(
+    "Select the revenue sharing model:",
+    ('Complex Model with Management Fees and Profit Share Threshold', 
+     'Simple Model with Conditional 30% Profit Share'
+     )
+)
+
+# Info section explaining both models
+st.info('''
+    **Model 1: Complex Model with Management Fees and Profit Share Threshold**  
+    - **Management Fees:** 5% on initial capital if the capital is ₹3 lakh or below, and 4% on capital above ₹3 lakh.  
+    - **Profit Sharing:** 20% sharing of profits only after an 6% return on capital is achieved.
+
+    **Model 2: Simple Model with Conditional 30% Profit Share**  
+    - **Profit Sharing:** 30% sharing on profits exceeding a threshold level of capital.
+    ''')
+
+# User inputs for initial capital and total portfolio returns
+initial_capital = st.number_input(
+    'Enter your initial capital in ₹:', 
+    min_value=300000.0, 
+    value=300000.0, 
+    step=10000.0
+)
+total_returns_input = st.number_input(
+    'Enter your average annual return percentage:', 
+    min_value=-10.0, 
+    value=30.0,  # Default set to 30%
+    step=0.1
+)
+
+# Model 1 management fees are billed monthly; the annual view charges the whole fee at year end
+fee_billing = st.radio(
+    'Management fee deduction for Model 1:',
+    ('Monthly', 'Annual'),
+    horizontal=True
+)
+billing = fee_billing.lower()
+fee_grid = core.get_fee_grid(billing)
+
+# Complex Model with Management Fees and Profit Share Threshold
+if model_choice == 'Complex Model with Management Fees and Profit Share Threshold':
+    st.markdown("### Complex Revenue Model with Management Fees and Profit Share Threshold")
+
+    # Complex Model logic (vectorized fee engine, single client)
+    years = np.arange(1, 6)
+    returns = np.full(len(years), total_returns_input / 100)
+    with PROFILER.section("fee model"):
+        schedule = fees.complex_schedule(initial_capital, returns, billing)
+    management_fee_percentage = schedule['management_fee_percentage'][0]
+
+    df_complex = pd.DataFrame({
+        'Year': years,
+        'Initial Capital (₹)': fees.to_rupees(schedule['start_capital'][0]),
+        'Total Capital (₹)': fees.to_rupees(schedule['total_capital'][0]),
+        'Net Capital After Fees (₹)': fees.to_rupees(schedule['net_capital'][0]),
+        f'{management_fee_percentage}% Management Fee (₹)': fees.to_rupees(schedule['management_fee'][0]),
+        '20% Profit Share Above 6% (₹)': fees.to_rupees(schedule['profit_share'][0]),
+    })
+
+    st.markdown("### Yearly Breakdown")
+    st.dataframe(df_complex)
+
+    # Note for Management Fees
+    st.markdown('''
+        <div style="margin-top: 20px; text-align: center; color: #4A4A4A;">
+            <strong>Note:</strong> <strong>The management fees are calculated annually but are deducted on a monthly basis. 
+            For instance, if the total annual management fees amount to ₹15,000, then ₹1,250 will be deducted each month.</strong>
+        </div>
+        ''', unsafe_allow_html=True)
+
+    with PROFILER.section("figure construction"):
+        fig_complex = go.Figure()
+
+        fig_complex.add_trace(go.Bar(
+            x=[f'Year {df_complex["Year"][i]}' for i in range(len(df_complex))],
+            y=[df_complex["Net Capital After Fees (₹)"][i] for i in range(len(df_complex))],
+            name='Net Capital After Fees',
+            text=[f'₹{df_complex["Net Capital After Fees (₹)"][i]:,}' for i in range(len(df_complex))],
+            textposition='outside',
+            marker=dict(color='#90EE90'),
+            showlegend=True
+        ))
+
+        fig_complex.add_trace(go.Bar(
+            x=[f'Year {df_complex["Year"][i]}' for i in range(len(df_complex))],
+            y=[df_complex[f'{management_fee_percentage}% Management Fee (₹)'][i] for i in range(len(df_complex))],
+            name=f'{management_fee_percentage}% Management Fee',
+            text=[f'₹{df_complex[f"{management_fee_percentage}% Management Fee (₹)"][i]:,}' for i in range(len(df_complex))],
+            textposition='inside',
+            marker=dict(color='#FF7F50'),
+            showlegend=True
+        ))
+
+        fig_complex.add_trace(go.Bar(
+            x=[f'Year {df_complex["Year"][i]}' for i in range(len(df_complex))],
+            y=[df_complex["20% Profit Share Above 6% (₹)"][i] for i in range(len(df_complex))],
+            name='20% Profit Share Above 6%',
+            text=[f'₹{df_complex["20% Profit Share Above 6% (₹)"][i]:,}' for i in range(len(df_complex))],
+            textposition='inside',
+            marker=dict(color='#1E90FF'),
+            showlegend=True
+        ))
+
+        fig_complex.update_layout(
+            title="Net Capital, Management Fees, and Profit Share Over 5 Years",
+            xaxis_title="Year",
+            yaxis_title="Amount in ₹",
+            plot_bgcolor='#ffffff',
+            title_x=0.5,
+            font=dict(color='#333333'),
+            yaxis=dict(showgrid=True),
+            barmode='stack',  
+            height=600
+        )
+
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_complex)
+
+elif model_choice == 'Simple Model with Conditional 30% Profit Share':
+    st.markdown("### Simple Model with Conditional 30% Profit Share")
+
+    years = np.arange(1, 6)
+    returns = np.full(len(years), total_returns_input / 100)  # Ensure returns are dynamically updated
+    with PROFILER.section("fee model"):
+        schedule = fees.simple_model(initial_capital, returns)
+    net_capital_after_fees = fees.to_rupees(schedule['net_capital'][0])
+
+    df_simple = pd.DataFrame({
+        'Year': years,
+        'Initial Capital (₹)': [int(initial_capital)] * len(years),
+        'Threshold (₹)': fees.to_rupees(schedule['threshold'][0]),  # Previous year's net capital after profit share
+        'Total Profit Generated (₹)': fees.to_rupees(schedule['total_profit'][0]),  # Total profit generated each year
+        '30% Profit Share Above Threshold (₹)': fees.to_rupees(schedule['profit_share'][0]),  # Profit shared
+        'Total Capital (₹)': fees.to_rupees(schedule['total_capital'][0]),  # Total capital before profit share deduction
+        'Net Capital After Profit Share (₹)': net_capital_after_fees
+    })
+
+    st.markdown("### Yearly Breakdown")
+    st.dataframe(df_simple)
+
+    # Calculate CAGR based on the final net capital after 5 years
+    final_capital = net_capital_after_fees[-1]
+    cagr = ((final_capital / initial_capital) ** (1 / len(years)) - 1) * 100
+
+    # Time to double capital using CAGR formula
+    years_to_double_pms = np.log(2) / np.log(1 + cagr / 100)
+
+    # Time to double capital with mutual fund at 15% return
+    years_to_double_mutual_fund = 1.09*(np.log(2)) / np.log(1 + 0.15)
+
+    # Time to double capital with FD at 6% return
+    years_to_double_fd = np.log(2) / np.log(1 + 0.06)
+
+    st.markdown(f"**Time to Double Capital with WhaleStreet PMS (Avg) after deducting all profit sharing & fees:** {years_to_double_pms:.2f} years")
+    st.markdown(f"**Time to Double Capital with top Mutual Funds (Avg) :** {years_to_double_mutual_fund:.2f} years")
+    st.markdown(f"**Time to Double Capital with Fixed Deposit (6% Annual Return):** {years_to_double_fd:.2f} years")
+
+    # Create a bar chart to compare the time to double capital
+    with PROFILER.section("figure construction"):
+        comparison_fig = go.Figure()
+
+        comparison_fig.add_trace(go.Bar(
+            x=['WhaleStreet PMS', 'Mutual Funds (15%)', 'Fixed Deposit (6%)'],
+            y=[years_to_double_pms, years_to_double_mutual_fund, years_to_double_fd],
+            text=[f'{years_to_double_pms:.2f} years', f'{years_to_double_mutual_fund:.2f} years', f'{years_to_double_fd:.2f} years'],
+            textposition='auto',
+            marker=dict(color=['#1E90FF', '#32CD32', '#FF6347'])
+        ))
+
+        comparison_fig.update_layout(
+            title="Comparison of Time to Double Capital",
+            xaxis_title="Investment Type",
+            yaxis_title="Years to Double Capital",
+            plot_bgcolor='#ffffff',
+            title_x=0.5,
+            font=dict(color='#333333'),
+            yaxis=dict(showgrid=True),
+            height=600
+        )
+
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(comparison_fig)
+
+    # Add the original profit sharing graph here
+    with PROFILER.section("figure construction"):
+        fig_simple = go.Figure()
+
+        fig_simple.add_trace(go.Bar(
+            x=[f'Year {df_simple["Year"][i]}' for i in range(len(df_simple))],
+            y=[df_simple["Net Capital After Profit Share (₹)"][i] for i in range(len(df_simple))],
+            name='Net Capital After Profit Share',
+            text=[f'₹{df_simple["Net Capital After Profit Share (₹)"][i]:,}' for i in range(len(df_simple))],
+            textposition='outside',
+            marker=dict(color='#90EE90'),
+            showlegend=True
+        ))
+
+        fig_simple.add_trace(go.Bar(
+            x=[f'Year {df_simple["Year"][i]}' for i in range(len(df_simple))],
+            y=[df_simple["30% Profit Share Above Threshold (₹)"][i] for i in range(len(df_simple))],
+            name='30% Profit Share Above Threshold',
+            text=[f'₹{df_simple["30% Profit Share Above Threshold (₹)"][i]:,}' for i in range(len(df_simple))],
+            textposition='inside',
+            marker=dict(color='#1E90FF'),
+            showlegend=True
+        ))
+
+        fig_simple.update_layout(
+            title="Net Capital and Profit Share Over 5 Years (Simple Model)",
+            xaxis_title="Year",
+            yaxis_title="Amount in ₹",
+            plot_bgcolor='#ffffff',
+            title_x=0.5,
+            font=dict(color='#333333'),
+            yaxis=dict(showgrid=True),
+            barmode='stack',  
+            height=600
+        )
+
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_simple)
+
+# Break-even gross return across initial capitals, with the current capital marked
+def build_breakeven(chart, theme):
+    curve = chart["curve"]
+    fig = go.Figure(go.Scatter(
+        x=curve["capital"],
+        y=curve["breakeven_return"] * 100,
+        mode='lines',
+        line=dict(color='#1E2D39', width=2),
+        name='Break-even return',
+        hovertemplate="Initial capital: ₹%{x:,.0f}<br>Break-even return: %{y:.2f}%<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Break-even Return Between Model 1 and Model 2",
+        xaxis_title="Initial Capital (₹)",
+        yaxis_title="Average Annual Return (%)",
+        xaxis_type="log",
+        plot_bgcolor='#ffffff',
+        title_x=0.5,
+        font=dict(color='#333333'),
+        yaxis=dict(showgrid=True),
+        height=500
+    )
+    fig.add_trace(go.Scatter(
+        x=[chart["capital"]],
+        y=[chart["breakeven"] * 100],
+        mode='markers',
+        name='Your capital',
+        marker=dict(color='#FF6347', size=12),
+        hovertemplate="Your capital: ₹%{x:,.0f}<br>Break-even return: %{y:.2f}%<extra></extra>"
+    ))
+    return fig
+
+# What-if answers come from the precomputed fee grid instead of recomputing both schedules
+st.markdown("### What-if: Net Capital Across Capital and Returns")
+model_key = 'complex' if model_choice.startswith('Complex') else 'simple'
+with PROFILER.section("fee grid lookup"):
+    outcomes = {model: fee_grid.net_capital(model, initial_capital, total_returns_input / 100)[-1]
+                for model in feegrid.MODELS}
+
+if np.isnan(outcomes[model_key]):
+    st.caption("These inputs are outside the precomputed grid (₹1 lakh to ₹10 crore, -10% to 100% a year).")
+else:
+    col1, col2 = st.columns(2)
+    col1.metric(f"Model 1 net capital after {fee_grid.years} years", f"₹{outcomes['complex']:,.0f}")
+    col2.metric(f"Model 2 net capital after {fee_grid.years} years", f"₹{outcomes['simple']:,.0f}",
+                delta=f"₹{outcomes['simple'] - outcomes['complex']:,.0f} vs Model 1")
+
+sensitivity_returns = np.arange(-10, 101, 1)
+with PROFILER.section("figure construction"):
+    chart = {
+        "title": f"Net Capital After {fee_grid.years} Years per ₹1 Invested ({'Model 1' if model_key == 'complex' else 'Model 2'})",
+        "returns": sensitivity_returns,
+        "capitals": feegrid.DEFAULT_CAPITALS,
+        "multiples": fee_grid.final_multiples(model_key, feegrid.DEFAULT_CAPITALS, sensitivity_returns / 100),
+        "inputs": (total_returns_input, initial_capital),
+    }
+    fig_sensitivity = figure_cache.figure("fee_sensitivity", build_sensitivity, chart, CHART_THEME)
+
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_sensitivity)
+
+# Fee outcomes when returns vary from year to year instead of staying at the average
+st.markdown("### Fees Under Volatile Returns")
+if st.toggle("Simulate volatile returns (Monte Carlo)"):
+    col1, col2 = st.columns(2)
+    volatility = col1.slider("Annual return volatility (%)", min_value=5.0, max_value=50.0, value=20.0, step=1.0) / 100
+    n_simulations = col2.select_slider("Number of simulated return paths", options=[1_000, 10_000, 100_000], value=10_000)
+    high_water_mark = st.checkbox(
+        "Model 2 with a high-water mark (no profit share until earlier losses are recovered)", value=True)
+
+    with PROFILER.section("simulation"):
+        fee_bands = simulate_fee_bands(initial_capital, total_returns_input / 100, volatility,
+                                       n_paths=n_simulations, high_water_mark=high_water_mark, billing=billing)
+
+    with PROFILER.section("figure construction"):
+        fig_fee_bands = go.Figure()
+        for model, label, color, fill in (('complex', 'Model 1', '#FF7F50', 'rgba(255, 127, 80, 0.2)'),
+                                          ('simple', 'Model 2', '#1E90FF', 'rgba(30, 144, 255, 0.2)')):
+            band = fee_bands.loc[(model, 'net_capital')]
+            fig_fee_bands.add_trace(go.Scatter(
+                x=band.index, y=band['p95'], mode='lines', line=dict(width=0),
+                showlegend=False, hoverinfo='skip'
+            ))
+            fig_fee_bands.add_trace(go.Scatter(
+                x=band.index, y=band['p5'], mode='lines', line=dict(width=0), fill='tonexty',
+                fillcolor=fill, name=f'{label} 5th-95th percentile', hoverinfo='skip'
+            ))
+            fig_fee_bands.add_trace(go.Scatter(
+                x=band.index, y=band['p50'], mode='lines+markers', line=dict(color=color, width=2),
+                name=f'{label} median', hovertemplate='Year %{x}<br>₹%{y:,.0f}<extra></extra>'
+            ))
+        fig_fee_bands.update_layout(
+            title=f"Net Capital Across {n_simulations:,} Simulated Return Paths",
+            xaxis_title="Year",
+            yaxis_title="Net Capital (₹)",
+            plot_bgcolor='#ffffff',
+            title_x=0.5,
+            font=dict(color='#333333'),
+            yaxis=dict(showgrid=True),
+            height=600
+        )
+
+    with PROFILER.section("st.plotly_chart"):
+        st.plotly_chart(fig_fee_bands)
+
+    # Year-end percentiles of net capital and of the fees paid so far
+    final_year = fee_bands.index.get_level_values('year').max()
+    summary = fee_bands.xs(final_year, level='year').drop(index=('simple', 'management_fee'))
+    summary.index = [f"{'Model 1' if model == 'complex' else 'Model 2'}: {measure.replace('_', ' ').title()}"
+                     for model, measure in summary.index]
+    st.markdown(f"**Percentiles after {final_year} years (₹, fees are cumulative)**")
+    st.dataframe(summary.round(0).astype('int64').rename(columns=str.capitalize))
+
+# Goal seek on the fee models: gross return needed for a net target, and where the models cross
+st.markdown("### Goal Seek: Required Returns and Break-even")
+target_net_return = st.number_input(
+    'Target net annual return after fees (%):',
+    min_value=0.0,
+    value=15.0,
+    step=0.5
+)
+with PROFILER.section("goal seek"):
+    required_returns = {model: goalseek.required_return(model, initial_capital, target_net_return / 100,
+                                                        billing=billing)[0]
+                        for model in feegrid.MODELS}
+    breakeven = goalseek.breakeven_return(initial_capital, billing=billing)[0]
+
+
+def as_percent(value):
+    return "Out of range" if np.isnan(value) else f"{value * 100:.2f}%"
+
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Model 1: gross return needed", as_percent(required_returns['complex']))
+col2.metric("Model 2: gross return needed", as_percent(required_returns['simple']))
+col3.metric("Break-even return between models", as_percent(breakeven))
+st.caption(f"Returns held constant for {goalseek.DEFAULT_YEARS} years. Below the break-even return Model 2 leaves "
+           "more net capital; above it Model 1 does.")
+
+with PROFILER.section("simulation"):
+    breakeven_curve = compute_breakeven_curve(billing)
+
+with PROFILER.section("figure construction"):
+    chart = {"curve": breakeven_curve, "capital": initial_capital, "breakeven": breakeven}
+    fig_breakeven = figure_cache.figure("breakeven", build_breakeven, chart, CHART_THEME)
+
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_breakeven)
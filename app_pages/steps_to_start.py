@@ -0,0 +1,108 @@
+import streamlit as st
+
+from whalestreet import fees
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/staircase.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Steps to Start Your Portfolio Management Service</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Begin Your Journey Towards Tailored Portfolio Management</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Steps with Icons
+st.markdown('''
+    <div style="background-color: #F7F7F7; padding: 20px; border-radius: 10px; box-shadow: 0px 0px 15px rgba(0, 0, 0, 0.1);">
+        <h3 style="color: #1E2D39;">Getting Started</h3>
+        <p style="font-size: 16px; color: #333333;">Follow these steps to begin your journey towards tailored portfolio management:</p>
+        <ul style="list-style-type: none; padding-left: 0; font-size: 16px; color: #1E2D39;">
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/conference-call.png" style="vertical-align: middle;"/>
+                <strong>1. Initial Consultation:</strong> Schedule a consultation with our portfolio managers to discuss your investment goals, risk tolerance, and financial horizon.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/security-checked.png" style="vertical-align: middle;"/>
+                <strong>2. Open a Demat Account:</strong> Register a demat account through our platform to hold your securities in digital format, making trading quick and secure.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/data-sheet.png" style="vertical-align: middle;"/>
+                <strong>3. Tailor Your Investment Plan:</strong> Based on the consultation, we'll design a customized investment strategy aligned with your objectives.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/cash-in-hand.png" style="vertical-align: middle;"/>
+                <strong>4. Fund Your Account:</strong> Transfer funds to your newly opened demat account to start the investment process.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/rocket.png" style="vertical-align: middle;"/>
+                <strong>5. Portfolio Activation:</strong> Once funded, your portfolio is activated and ready to start working for you.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/007ACC/pie-chart-report.png" style="vertical-align: middle;"/>
+                <strong>6. Regular Reporting and Rebalancing:</strong> Receive regular reports on your portfolio's performance. We’ll adjust as needed to align with your financial goals.
+            </li>
+        </ul>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Title with icon for Conditions & Rules
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/law.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Conditions & Rules</h2>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Main content with background and padding for Conditions & Rules
+st.markdown('''
+    <div style="background-color: #F0F4F8; padding: 20px; border-radius: 10px; box-shadow: 0px 0px 15px rgba(0, 0, 0, 0.1);">
+        <h3 style="color: #1E2D39;">Important Conditions and Rules</h3>
+        <ul style="list-style-type: none; padding-left: 0; font-size: 16px; color: #1E2D39;">
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/lock.png" style="vertical-align: middle;"/> 
+            <strong>Lock-in Period:</strong> While there is no strict lock-in period, if you choose to withdraw your capital before 2 year, a 3% additional charge will apply, and the funds you receive will be based on the market conditions at that time. However, if you withdraw after 2 year with 15 days prior notice, there will be no charges, and <strong>we guarantee that your deployed capital will not incur any loss. In the unlikely event of any loss after 2 year, we will cover the difference between your deployed capital and the net capital after the loss</strong>.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/money-bag.png" style="vertical-align: middle;"/> 
+            <strong>Additional Contributions:</strong> You can make additional investments anytime.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/bill.png" style="vertical-align: middle;"/> 
+            <strong>Fees and Charges:</strong> For <strong>Model 1</strong>, the management fees are 5% annually for capital amounts up to ₹300,000, and 4% annually for amounts exceeding ₹300,000, with an additional 20% performance fee applied to returns exceeding 6% per year.\nIn <strong>Model 2</strong>, a 30% performance fee is applied to returns above a specified threshold.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/security-shield-green.png" style="vertical-align: middle;"/> 
+            <strong>Risk Management:</strong> Our strategies are focused on long-term growth, with measures in place to mitigate risk.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/bar-chart.png" style="vertical-align: middle;"/> 
+            <strong>Reporting:</strong> We provide quarterly performance reports to keep you informed of your portfolio's status.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/rebalance-portfolio.png" style="vertical-align: middle;"/> 
+            <strong>Rebalancing:</strong> The portfolio may be rebalanced periodically to align with your financial goals.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/close-sign.png" style="vertical-align: middle;"/> 
+            <strong>Termination of Service:</strong> Either party can terminate the service with a 30-day notice period, following the settlement of any profit-sharing fees.</li>
+            <li style="margin-bottom: 15px;"><img src="https://img.icons8.com/ios-filled/30/FF6347/check-all.png" style="vertical-align: middle;"/> 
+            <strong>Compliance:</strong> We strictly adhere to all relevant regulations to protect our clients' interests.</li>
+        </ul>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Section for Possible Outcomes
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/1E2D39/light-at-the-end-of-tunnel.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">"Possible Prospects: Navigating Portfolio Changes"
+</h2>
+    </div>
+    ''', unsafe_allow_html=True)
+
+st.markdown('''
+    <div style="background-color: #FFF8E7; padding: 20px; border-radius: 10px; box-shadow: 0px 0px 15px rgba(0, 0, 0, 0.1);">
+        <h3 style="color: #1E2D39;">What You Might Experience During Your Investment Journey</h3>
+        <ul style="list-style-type: none; padding-left: 0; font-size: 16px; color: #1E2D39;">
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/FFD700/money-transfer.png" style="vertical-align: middle;"/>
+                <strong>Temporary Idle Funds:</strong> There may be times when certain funds in your demat account remain uninvested for 1-2 months. This is a deliberate strategy based on market conditions and sentiment. We avoid unnecessary investments in random stocks irrespective of market signals. Rest assured, our expert managers know the optimal times to deploy your funds effectively. Even with temporary idle funds, your portfolio is managed to achieve the desired annual returns. Trust us to handle these decisions on your behalf.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/FFD700/graph.png" style="vertical-align: middle;"/>
+                <strong>Short-Term Unrealized Losses:</strong> It’s normal for portfolios to experience temporary dips, sometimes even between -10% to -14%. However, there's no need for concern. With our expert management and strategic approach, we are well-equipped to navigate these fluctuations and guide your portfolio back to growth. With our carefully crafted mean-reverting strategies and overall porfolio beta and correlation, these downturns are short-lived. We are confident that your portfolio will achieve the desired returns by the end of the year. Patience is key, and you can trust that your investment is being expertly managed to ensure long-term success.
+            </li>
+            <li style="margin-bottom: 15px;">
+                <img src="https://img.icons8.com/ios-filled/30/FFD700/safe.png" style="vertical-align: middle;"/>
+                <strong>Capital Safety with Consistent Returns:</strong> Your capital is our foremost priority, and we adopt a conservative yet effective approach to portfolio management. Despite the cautious strategy, we consistently achieve annual returns in the range of 25-30%, with 0% realized drawdown. This disciplined investment approach not only mitigates risk but also ensures steady growth, even in volatile market conditions. You can trust that your capital is in safe hands, managed with a focus on both protection and performance.
+            </li>
+        </ul>
+    </div>
+    ''', unsafe_allow_html=True)
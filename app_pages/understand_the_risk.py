@@ -0,0 +1,135 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from whalestreet import core
+from whalestreet.theme import CHART_THEME
+
+PROFILER = core.profiler()
+figure_cache = core.get_figure_cache()
+
+# Header for the Risk Understanding section with an icon
+st.markdown('''
+    <div style="text-align: center; padding: 30px 0; border-bottom: 3px solid #004080; background-color: #f4f8ff;">
+        <img src="https://img.icons8.com/ios-filled/50/000000/warning-shield.png" width="50"/>
+        <h2 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 15px;">Understand the Risk</h2>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Subsection: PMS Service Fraud Risk
+st.markdown('''
+    <div style="border: 2px solid #004080; background-color: #e8f4ff; padding: 20px; border-radius: 10px; margin-top: 30px;">
+        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+            <img src="https://img.icons8.com/ios-filled/50/000000/security-checked.png" width="35" style="margin-right: 15px;"/>
+            <h3 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold; margin: 0;">PMS Service Fraud Risk</h3>
+        </div>
+        <p style="color:#333; font-size:16px;">Portfolio Management Services (PMS) often involve transferring funds to the service provider's account, leading to potential fraud risks. However, at Whalestreet, your funds stay securely in your demat account, ensuring you retain full control and reducing fraud risk to 0%.</p>
+        <p style="color:#555; font-size:14px; text-align: center; margin-top: 20px;">Your funds stay securely in your demat account.</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Subsection: Market Risk
+st.markdown('''
+    <div style="border: 2px solid #004080; background-color: #e8f4ff; padding: 20px; border-radius: 10px; margin-top: 30px;">
+        <div style="display: flex; align-items: center; margin-bottom: 15px;">
+            <img src="https://img.icons8.com/ios-filled/50/000000/line-chart.png" width="35" style="margin-right: 15px;"/>
+            <h3 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold; margin: 0;">Market Risk: Worst-Case and Most Expected Scenarios</h3>
+        </div>
+        <p style="color:#333; font-size:16px;">While the probability of experiencing a worst-case scenario is low (just <strong>1-5%</strong>), it’s essential to understand the range of possible outcomes. Here’s what you can expect:</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Graph for Probability of Worst-Case and Most Expected Returns for Each Year with Return Ranges
+outcomes = ["10-13% Loss", "25-30% Return"]  # Year 1 return ranges
+probabilities_year1 = [5, 95]  # Year 1 probabilities: 5% worst case, 95% most expected
+outcomes_year2 = ["0% Return", "50-60% Return"]  # Year 2 return ranges
+probabilities_year2 = [3, 97]  # Year 2 probabilities: 3% worst case, 97% most expected
+outcomes_year3 = ["21.78-30% Return", ">70% Return"]  # Year 3 return ranges
+probabilities_year3 = [1, 99]  # Year 3 probabilities: 1% worst case, 99% most expected
+
+def build_distribution(scenarios, theme):
+    outcomes, probabilities_year1, outcomes_year2, probabilities_year2, outcomes_year3, probabilities_year3 = scenarios
+    fig_distribution = go.Figure()
+
+    # Adding bars for each year with return ranges in the labels
+    fig_distribution.add_trace(go.Bar(
+        x=outcomes,
+        y=probabilities_year1,
+        name='Year 1',
+        marker=dict(color='#1f77b4'),
+        text=[f'{prob}% for {outcome}' for prob, outcome in zip(probabilities_year1, outcomes)],
+        textposition='auto'
+    ))
+
+    fig_distribution.add_trace(go.Bar(
+        x=outcomes_year2,
+        y=probabilities_year2,
+        name='Year 2',
+        marker=dict(color='#ff7f0e'),
+        text=[f'{prob}% for {outcome}' for prob, outcome in zip(probabilities_year2, outcomes_year2)],
+        textposition='auto'
+    ))
+
+    fig_distribution.add_trace(go.Bar(
+        x=outcomes_year3,
+        y=probabilities_year3,
+        name='Year 3',
+        marker=dict(color='#2ca02c'),
+        text=[f'{prob}% for {outcome}' for prob, outcome in zip(probabilities_year3, outcomes_year3)],
+        textposition='auto'
+    ))
+
+    fig_distribution.update_layout(
+        title='Probability of Worst-Case and Most Expected Returns Over 3 Years',
+        xaxis_title='Return Range',
+        yaxis_title='Probability (%)',
+        barmode='group',
+        title_x=0.5,
+        paper_bgcolor="#f4f4f4",
+        plot_bgcolor="#f4f4f4",
+        font=dict(color='#333', size=14)
+    )
+
+    return fig_distribution
+
+with PROFILER.section("figure construction"):
+    fig_distribution = figure_cache.figure(
+        "risk_distribution", build_distribution,
+        (outcomes, probabilities_year1, outcomes_year2, probabilities_year2, outcomes_year3, probabilities_year3),
+        CHART_THEME)
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_distribution)
+
+# Breakdown of Worst-Case Scenarios with Explanation and Trust-Building
+st.markdown("""
+    <div style="border: 2px solid #004080; background-color: #e8f4ff; padding: 20px; border-radius: 10px; margin-top: 30px;">
+        <ul style="color:#333; font-size:16px; padding-left: 20px;">
+            <li><strong>First Year:</strong> The maximum unrealized loss could range from <strong>10% to 13%</strong>, with the probability of such a loss being only <strong>1-5%</strong>. This scenario might occur during an extreme market downturn or unforeseen global events. However, it’s important to note that historically, this has never happened. There is a <strong>95-99% confidence level</strong> for a return of approximately <strong>25-30%</strong>, based on past performance trends.</li>
+            <li><strong>Second Year:</strong> The worst case is that your capital remains unchanged with a <strong>1-3%</strong> probability, likely due to prolonged market stagnation. However, if the investment is continued, there is a <strong>97-99% confidence level</strong> of generating a return of approximately <strong>50-60%</strong>, which is far greater than typical returns from Nifty benchmarks or fixed deposits.</li>
+            <li><strong>Third Year:</strong> The worst-case scenario suggests a net return between <strong>21.78-30%</strong> with a <strong>1-3%</strong> probability, potentially due to long-term market volatility. Even in such a rare case, the portfolio is expected to outperform traditional investments, as there is a <strong>97-99% confidence level</strong> that returns will exceed <strong>70%</strong>, which is significantly higher than the average Nifty benchmark return over three years.</li>
+        </ul>
+        <p style="color:#333; font-size:16px;">These projections highlight our commitment to managing and anticipating potential risks while aligning your investments with long-term financial growth. Even in the unlikely event of encountering the worst-case scenario, the expected returns are projected to outperform major benchmarks, thereby building a solid foundation of trust for your financial future.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Visual to reinforce the expected return range along with max and min returns from past 3 years
+st.markdown('''
+    <div style="border: 2px solid #004080; padding: 20px; border-radius: 10px; margin-top: 30px; background-color: #f4f8ff; text-align: center;">
+        <img src="https://img.icons8.com/ios-filled/100/004080/graph.png" width="100"/>
+        <h3 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Expected Annual Return Range</h3>
+        <div style="display: flex; justify-content: space-around; margin-top: 30px;">
+            <div style="text-align: center;">
+                <h4 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold;">Maximum Yearly Return</h4>
+                <p style="color:#333; font-size:16px;"><strong>43.67%</strong></p>
+            </div>
+            <div style="text-align: center;">
+                <h4 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold;">Expected Annual Return</h4>
+                <p style="color:#333; font-size:16px;"><strong>26-35%</strong></p>
+            </div>
+            <div style="text-align: center;">
+                <h4 style="color: #004080; font-family: 'Arial', sans-serif; font-weight: bold;">Minimum Yearly Return</h4>
+                <p style="color:#333; font-size:16px;"><strong>20.78%</strong></p>
+            </div>
+        </div>
+        <p style="color:#333; font-size:16px; text-align: center;">These figures are based on the last three years' trends, providing a robust foundation for understanding the potential returns of your investment.</p>
+    </div>
+    ''', unsafe_allow_html=True)
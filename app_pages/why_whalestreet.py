@@ -0,0 +1,188 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from whalestreet import core
+from whalestreet.theme import CHART_THEME
+
+PROFILER = core.profiler()
+figure_cache = core.get_figure_cache()
+
+# Section Title with Icon and Styled Heading
+st.markdown('''
+    <div style="text-align: center; padding: 20px 0;">
+        <img src="https://img.icons8.com/ios-filled/50/000000/trophy.png" width="50"/>
+        <h2 style="color: #1E2D39; font-family: 'Arial', sans-serif; font-weight: bold; margin-top: 10px;">Why Whalestreet PMS Stands Out</h2>
+        <p style="color: #4A4A4A; font-size: 18px; margin-top: 10px;">Discover the Unique Advantages We Offer Over Other PMS Providers</p>
+    </div>
+    ''', unsafe_allow_html=True)
+
+# Add a visual bar chart comparing feature satisfaction rates
+st.markdown("### Client Satisfaction Across Key Features")
+
+# Example data for satisfaction rates using a 0-100% scale
+satisfaction_data = {
+    "Feature": ["Transparent Reporting", "Monthly Settlements", "Investment Visibility", "Fraud Protection", "Strong Returns", "Personalized Guidance", "Direct Income Access", "100% No Loss Guarantee"],
+    "Whalestreet PMS": [97, 93, 98, 100, 92, 94, 97, 100],
+    "Other PMS": [65, 50, 55, 60, 70, 50, 45, 0]
+}
+
+satisfaction_df = pd.DataFrame(satisfaction_data)
+
+def build_satisfaction(satisfaction_df, theme):
+    fig_satisfaction = px.bar(
+        satisfaction_df, 
+        x="Feature", 
+        y=["Whalestreet PMS", "Other PMS"], 
+        barmode="group", 
+        title="Client Satisfaction Comparison",
+        color_discrete_map={"Whalestreet PMS": "#1E2D39", "Other PMS": "#FF6347"}
+    )
+    fig_satisfaction.update_layout(
+        xaxis_title="Feature",
+        yaxis_title="Satisfaction (%)",
+        plot_bgcolor='#ffffff',
+        title_x=0.5,
+        font=dict(color='#333333'),
+        yaxis=dict(
+            tickformat=".0%", 
+            showgrid=True, 
+            gridcolor='#dddddd',
+            range=[0, 100]  # Ensures the y-axis is scaled from 0% to 100%
+        ),
+        xaxis=dict(showgrid=False)
+    )
+    return fig_satisfaction
+
+with PROFILER.section("figure construction"):
+    fig_satisfaction = figure_cache.figure("satisfaction", build_satisfaction, satisfaction_df, CHART_THEME)
+with PROFILER.section("st.plotly_chart"):
+    st.plotly_chart(fig_satisfaction)
+
+# Comparison Table with Structured Borders and Dropdown Explanations
+st.markdown('''
+    <table style="width:100%; border-collapse: collapse; margin: 20px 0; font-size: 18px; text-align: center; border: 1px solid #dddddd;">
+      <thead>
+        <tr style="background-color: #1E2D39; color: white;">
+          <th style="padding: 10px; border: 1px solid #dddddd;">Key Benefits</th>
+          <th style="padding: 10px; border: 1px solid #dddddd;">Whalestreet PMS</th>
+          <th style="padding: 10px; border: 1px solid #dddddd;">Other PMS Providers</th>
+        </tr>
+      </thead>
+      <tbody>
+        <tr>
+          <td style="padding: 10px; background-color: #f0f0f0; border: 1px solid #dddddd;">
+            <strong>Clear and Transparent Reporting</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">At Whalestreet, we provide detailed reports that are easy to understand. You can see exactly how your investments are performing at any time.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; border: 1px solid #dddddd;">
+            <strong>Monthly Settlements</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">We settle accounts on a monthly basis, providing regular updates and transparency in all transactions.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; background-color: #f0f0f0; border: 1px solid #dddddd;">
+            <strong>Full Visibility of Your Investments</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">You can see exactly where your money is invested and track the performance of your positions in real time.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; border: 1px solid #dddddd;">
+            <strong>No Risk of Fraud - Your Capital Stays with You</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">Your investments remain in your account at all times. We only manage your investments, ensuring that your capital is secure and under your control.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; background-color: #f0f0f0; border: 1px solid #dddddd;">
+            <strong>Strong and Consistent Returns</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">Our investment strategies are designed to deliver consistent returns, helping you achieve your financial goals effectively.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; border: 1px solid #dddddd;">
+            <strong>Personalized Guidance Every Week</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">We provide weekly updates and personalized advice to keep you informed and confident in your investment strategy.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; background-color: #f0f0f0; border: 1px solid #dddddd;">
+            <strong>Direct Access to All Income (Dividends, Splits, Bonuses)</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">All financial income, such as dividends, splits, and bonuses, is credited directly to your bank account with no sharing, ensuring you get the full benefit of your investments.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+        <tr>
+          <td style="padding: 10px; background-color: #f0f0f0; border: 1px solid #dddddd;">
+            <strong>100% No Loss Guarantee</strong>
+            <div style="text-align: left;">
+              <details>
+                <summary>More Info</summary>
+                <p style="margin: 10px 0;">We offer a 100% no-loss guarantee if you hold your investment for at least 2 years. In the unlikely event of any loss after 2 years, we will cover the difference between your deployed capital and the net realized capital.</p>
+              </details>
+            </div>
+          </td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/228B22/checked--v1.png" width="30"/></td>
+          <td style="padding: 10px; border: 1px solid #dddddd;"><img src="https://img.icons8.com/ios-filled/50/FF6347/cancel.png" width="30"/></td>
+        </tr>
+      </tbody>
+    </table>
+    ''', unsafe_allow_html=True)
+
+
+# Summary Section with Structured Borders
+st.markdown('''
+    <div style="background-color: #f0f0f0; padding: 20px; border-radius: 10px; border: 1px solid #dddddd;">
+        <h3 style="color: #1E2D39;">Why Choose Whalestreet PMS?</h3>
+        <p style="font-size: 16px; color: #333333;">At Whalestreet, we believe in giving you full control and peace of mind. Unlike other providers, we ensure transparency in all our reports, allow you to see exactly where your money is invested, and guarantee that your capital remains in your account, reducing any risk of fraud. Additionally, we provide personalized weekly guidance and make sure that all dividends, splits, and bonuses go directly to your bank account, ensuring you get the most out of your investments.</p>
+    </div>
+    ''', unsafe_allow_html=True)
@@ -0,0 +1,136 @@
+"""Benchmark the render of every dashboard page headlessly.
+
+Each page is measured in a fresh interpreter with Streamlit's AppTest:
+
+* ``cold_s``: first render of the page after the app starts (empty caches),
+* ``warm_s``: median of ``--repeat`` reruns of the page,
+* ``peak_mb``: peak Python heap (tracemalloc) of a render with cleared caches,
+* ``payload_kb``: serialized size of all elements the page sends.
+
+Results can be saved as a baseline and later runs compared against it;
+the exit status is 1 when a page regressed. Run from the repository root:
+
+    python benchmarks/pages.py --save-baseline benchmarks/baseline.json
+    python benchmarks/pages.py --baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from startup import APP, PAGE_SCRIPTS, PAGES
+
+METRICS = ("cold_s", "warm_s", "peak_mb", "payload_kb")
+
+# Differences below these are noise, whatever the relative change
+NOISE_FLOOR = {"cold_s": 0.05, "warm_s": 0.02, "peak_mb": 1.0, "payload_kb": 1.0}
+
+_CHILD = """
+import json, statistics, sys, time, tracemalloc
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+app, page, repeat = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+def payload_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    return size + sum(payload_bytes(child) for child in getattr(node, "children", {}).values())
+
+def render_page(at):
+    started = time.perf_counter()
+    at.switch_page(page).run()
+    return time.perf_counter() - started
+
+at = AppTest.from_file(app, default_timeout=300)
+at.run()
+cold = render_page(at)
+warm = []
+for _ in range(repeat):
+    started = time.perf_counter()
+    at.run()
+    warm.append(time.perf_counter() - started)
+payload = payload_bytes(at._tree)
+
+st.cache_data.clear()
+st.cache_resource.clear()
+at = AppTest.from_file(app, default_timeout=300)
+at.run()
+tracemalloc.start()
+render_page(at)
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+
+print(json.dumps({"cold_s": cold, "warm_s": statistics.median(warm), "peak_mb": peak / 2 ** 20,
+                  "payload_kb": payload / 1024, "errors": len(at.exception)}))
+"""
+
+
+def measure(page, app=APP, repeat=5):
+    output = subprocess.run([sys.executable, "-c", _CHILD, app, PAGE_SCRIPTS[page], str(repeat)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def regressions(results, baseline, tolerances):
+    """``(page, metric, baseline, current)`` for every metric past its tolerance."""
+    found = []
+    for page, result in results.items():
+        reference = baseline.get(page)
+        if reference is None:
+            continue
+        for metric in METRICS:
+            before, after = reference.get(metric), result[metric]
+            if before is None:
+                continue
+            if after - before > max(before * tolerances[metric], NOISE_FLOOR[metric]):
+                found.append((page, metric, before, after))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=APP, help="Streamlit script to measure")
+    parser.add_argument("--page", action="append", choices=PAGES,
+                        help="Page to measure (repeatable, default: all pages)")
+    parser.add_argument("--repeat", type=int, default=5, help="Warm reruns per page")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown of cold and warm renders")
+    parser.add_argument("--memory-tolerance", type=float, default=0.20,
+                        help="Allowed relative growth of peak memory")
+    parser.add_argument("--payload-tolerance", type=float, default=0.05,
+                        help="Allowed relative growth of the payload")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'Page':<36}{'Cold (s)':>10}{'Warm (s)':>10}{'Peak (MB)':>11}{'Payload (KB)':>14}")
+    for page in args.page or PAGES:
+        result = results[page] = measure(page, args.app, args.repeat)
+        flag = "  (errors)" if result["errors"] else ""
+        print(f"{page:<36}{result['cold_s']:>10.3f}{result['warm_s']:>10.3f}"
+              f"{result['peak_mb']:>11.1f}{result['payload_kb']:>14.1f}{flag}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save_baseline}")
+
+    failed = any(result["errors"] for result in results.values())
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        tolerances = {"cold_s": args.time_tolerance, "warm_s": args.time_tolerance,
+                      "peak_mb": args.memory_tolerance, "payload_kb": args.payload_tolerance}
+        found = regressions(results, baseline, tolerances)
+        for page, metric, before, after in found:
+            print(f"REGRESSION {page}: {metric} {before:.3f} -> {after:.3f}")
+        if not found:
+            print("No regressions against the baseline")
+        failed = failed or bool(found)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
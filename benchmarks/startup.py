@@ -0,0 +1,64 @@
+"""Measure the cold-start render time of every dashboard page.
+
+Each page is rendered in a fresh interpreter so that imports are never
+shared between measurements: the app is run once (landing on "Overview")
+and then switched to the page under test. Run from the repository root:
+
+    python benchmarks/startup.py
+
+See pages.py for repeated renders, memory and payload size.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "30%_whalestreet_pms_documentation.py")
+
+sys.path.insert(0, ROOT)
+from whalestreet.navigation import PAGES as _NAVIGATION  # noqa: E402
+
+# Page title -> page script, in sidebar order
+PAGE_SCRIPTS = {title: path for path, title in _NAVIGATION}
+PAGES = list(PAGE_SCRIPTS)
+
+_CHILD = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+app, page = sys.argv[1], sys.argv[2]
+at = AppTest.from_file(app, default_timeout=300)
+started = time.perf_counter()
+at.run()
+first_run = time.perf_counter() - started
+started = time.perf_counter()
+at.switch_page(page).run()
+page_run = time.perf_counter() - started
+print(json.dumps({"first_run": first_run, "page_run": page_run, "errors": len(at.exception)}))
+"""
+
+
+def measure(page, app=APP):
+    output = subprocess.run([sys.executable, "-c", _CHILD, app, PAGE_SCRIPTS[page]],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=APP, help="Streamlit script to measure")
+    parser.add_argument("--page", action="append", choices=PAGES,
+                        help="Page to measure (repeatable, default: all pages)")
+    args = parser.parse_args()
+
+    print(f"{'Page':<36}{'First run (s)':>15}{'Cold page (s)':>15}")
+    for page in args.page or PAGES:
+        result = measure(page, args.app)
+        flag = "  (errors)" if result["errors"] else ""
+        print(f"{page:<36}{result['first_run']:>15.3f}{result['page_run']:>15.3f}{flag}")
+
+
+if __name__ == "__main__":
+    main()
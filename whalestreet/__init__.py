@@ -0,0 +1 @@
+"""Compute core and shared Streamlit layer for the Whalestreet PMS dashboard."""
@@ -0,0 +1,316 @@
+"""Streamlit-cached data loaders and shared resources for the dashboard pages.
+
+Every page imports what it needs from here, so a page only loads and
+computes its own data. The heavy lifting lives in the other ``whalestreet``
+modules; this module adds Streamlit's caching and the per-run profiler.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.logger import get_logger
+
+from whalestreet import covariance, data, feegrid, fees, figures, forecasting, goalseek, ledger, metrics, montecarlo, optimizer, profiling, rolling, scenarios
+
+LOGGER = get_logger(__name__)
+
+_PROFILER_KEY = "_whalestreet_profiler"
+
+# Seeded simulations are cached across reruns and sessions; the cache is keyed on
+# the function arguments, bounded in size and evicts least recently used entries
+SIMULATION_CACHE_ENTRIES = 32
+SIMULATION_CACHE_TTL = 24 * 60 * 60  # seconds
+TRADING_DAYS_PER_YEAR = 252
+MARKET_DATA_TTL = 6 * 60 * 60  # seconds; the on-disk price cache makes refreshes incremental
+
+# Asset classes of the allocation as (annual mean return, annual volatility), with their
+# correlations; used to simulate their history for the optimizer
+ASSET_UNIVERSE = {
+    "Large Cap": (0.12, 0.15),
+    "Mid Cap": (0.15, 0.19),
+    "Small Cap": (0.17, 0.23),
+}
+ASSET_CORRELATION = ((1.0, 0.85, 0.75),
+                     (0.85, 1.0, 0.90),
+                     (0.75, 0.90, 1.0))
+# Current allocation in %; Black-Litterman treats it as the market portfolio
+MARKET_WEIGHTS = {"Large Cap": 50, "Mid Cap": 30, "Small Cap": 20}
+# Benchmark simulated alongside the asset classes: (annual mean return, annual volatility)
+# and its correlation with each asset class
+BENCHMARK = "Nifty 50"
+BENCHMARK_MOMENTS = (0.11, 0.14)
+BENCHMARK_CORRELATION = (0.95, 0.85, 0.75)
+# Trailing windows (in trading days) for beta, correlation and tracking error
+BENCHMARK_WINDOWS = {"3 months": 63, "6 months": 126, "1 year": 252, "3 years": 756}
+WITHDRAWAL_LOCK_IN_YEARS = 2  # capital is protected for withdrawals after this many years
+# Worst-case outcomes take each losing scenario as recorded and up to a quarter harsher
+WORST_CASE_SEVERITIES = tuple(np.linspace(1.0, 1.25, 6))
+
+# Performance series and ratios from monthly portfolio and Nifty 50 returns
+def performance_from_returns(months, portfolio_returns, nifty_returns):
+    cumulative_returns = (1 + pd.Series(portfolio_returns)).cumprod() - 1
+    cumulative_nifty_returns = (1 + pd.Series(nifty_returns)).cumprod() - 1
+    fd_returns = np.full(len(months), 0.06 / 12)
+    cumulative_fd_returns = (1 + pd.Series(fd_returns)).cumprod() - 1
+    drawdowns = metrics.drawdown(pd.Series(portfolio_returns))  # Running peak-to-trough drawdown
+    sharpe_ratio = metrics.sharpe_ratio(portfolio_returns)
+    sortino_ratio = metrics.sortino_ratio(portfolio_returns)
+    return months, cumulative_returns, cumulative_nifty_returns, cumulative_fd_returns, drawdowns, sharpe_ratio, sortino_ratio
+
+# Function to simulate performance data
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_performance_data(seed=42, periods=36, start='2020-01-01'):
+    rng = np.random.RandomState(seed)
+    months = pd.date_range(start=start, periods=periods, freq='M')
+    portfolio_returns = rng.normal(loc=0.01, scale=0.02, size=len(months))
+    nifty_returns = rng.normal(loc=0.008, scale=0.015, size=len(months))
+    return performance_from_returns(months, portfolio_returns, nifty_returns)
+
+# Daily portfolio and Nifty 50 closes from the configured price source, or None
+# when the dashboard runs on simulated data (see whalestreet/data.py)
+@st.cache_data(ttl=MARKET_DATA_TTL, show_spinner="Loading market data...")
+def load_market_history(years=10):
+    store = data.store_from_env()
+    if store is None:
+        return None
+    portfolio_symbol, benchmark_symbol = data.configured_symbols()
+    start = pd.Timestamp.today().normalize() - pd.DateOffset(years=years)
+    try:
+        history = pd.DataFrame({
+            "Portfolio": store.history(portfolio_symbol, start),
+            "Nifty 50": store.history(benchmark_symbol, start),
+        }).dropna()
+    except Exception as exc:
+        LOGGER.warning("Falling back to simulated data, market data unavailable: %s", exc)
+        return None
+    if len(history) < 2:
+        LOGGER.warning("Falling back to simulated data, no overlapping price history")
+        return None
+    return history
+
+# Performance data for the dashboard: real monthly returns when a price source
+# is configured, the seeded simulation otherwise
+def load_performance_data(periods=36):
+    history = load_market_history()
+    if history is None:
+        return simulate_performance_data(periods=periods)
+    monthly = data.monthly_returns(history).tail(periods)
+    return performance_from_returns(monthly.index, monthly["Portfolio"].to_numpy(), monthly["Nifty 50"].to_numpy())
+
+# Simulated daily portfolio history for the rolling-window metrics
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_daily_returns(seed=42, years=10, start='2015-01-01'):
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range(start=start, periods=years * TRADING_DAYS_PER_YEAR)
+    return pd.Series(rng.normal(loc=0.0005, scale=0.011, size=len(days)), index=days, name="Portfolio")
+
+# Daily portfolio returns for the rolling metrics, real or simulated like above
+def load_daily_returns():
+    history = load_market_history()
+    if history is None:
+        return simulate_daily_returns()
+    return data.daily_returns(history["Portfolio"])
+
+# Rolling metrics are computed in one incremental pass and cached per window
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_rolling_metrics(daily_returns, window_months):
+    window = window_months * TRADING_DAYS_PER_YEAR // 12
+    return rolling.rolling_metrics(daily_returns, window, periods_per_year=TRADING_DAYS_PER_YEAR).dropna()
+
+# Simulated one-year Portfolio vs Nifty 50 series and the active management series
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_strategy_performance(seed=42, periods=12, active_days=100):
+    rng = np.random.RandomState(seed)  # For reproducibility, without touching the global RNG other sessions use
+
+    one_year_dates = pd.date_range(start='1/1/2023', periods=periods, freq='M')
+    nifty_50_fluctuations = rng.normal(0.8, 1.5, len(one_year_dates)).cumsum() + 100
+    portfolio_fluctuations = nifty_50_fluctuations + rng.normal(0.5, 1.0, len(one_year_dates))  # Ensuring realistic fluctuations and outperformance
+
+    # Ensuring portfolio always ends higher than Nifty 50
+    portfolio_fluctuations[-1] = nifty_50_fluctuations[-1] + np.abs(rng.normal(5, 1))  # Final value adjusted to be higher
+
+    time_series_data_one_year = pd.DataFrame({
+        "Date": one_year_dates,
+        "Portfolio": portfolio_fluctuations,
+        "Nifty 50": nifty_50_fluctuations
+    })
+
+    # Active management series continue from the same random stream
+    time_series_data_active = pd.DataFrame({
+        "Date": pd.date_range(start='1/1/2020', periods=active_days),
+        "Active Strategy Returns": 100 + rng.normal(1.0, 2.5, active_days).cumsum(),
+        "Benchmark Returns": 100 + rng.normal(0.5, 2.0, active_days).cumsum()
+    })
+    return time_series_data_one_year, time_series_data_active
+
+# Monte Carlo growth projection reduced to percentile bands (see whalestreet.montecarlo)
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_growth_bands(n_paths=100_000, horizon=12, drift=0.01, volatility=0.02, seed=42, workers=1):
+    # Results are identical for any number of workers; only the wall time changes
+    return montecarlo.simulate_percentile_bands(n_paths=n_paths, horizon=horizon, drift=drift,
+                                                volatility=volatility, seed=seed, workers=workers)
+
+# Monthly portfolio returns over the whole daily history, real or simulated like above
+def load_monthly_returns():
+    return data.monthly_returns((1 + load_daily_returns()).cumprod())
+
+# Growth paths bootstrapped from historical monthly returns, reduced to the same percentile bands
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_bootstrap_bands(history, n_paths=100_000, horizon=12, mean_block_length=6, seed=42, workers=1):
+    return montecarlo.simulate_bootstrap_bands(history, n_paths=n_paths, horizon=horizon,
+                                               mean_block_length=mean_block_length, seed=seed, workers=workers)
+
+# Both fee models over random annual return paths, reduced to percentile bands (see fees.fee_bands)
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_fee_bands(initial_capital, mean_return, volatility, n_paths=10_000, years=5,
+                       high_water_mark=True, billing='annual', seed=42):
+    # Both models see the same paths, so their bands are directly comparable
+    returns = montecarlo.simulate_return_paths(n_paths, years, mean_return, volatility, seed)
+    return fees.fee_bands(initial_capital, returns, high_water_mark=high_water_mark, billing=billing)
+
+# Break-even gross return between the two fee models across initial capitals (see whalestreet.goalseek)
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_breakeven_curve(billing='annual', points=200):
+    capitals = np.geomspace(1e5, 1e8, points)
+    return pd.DataFrame({
+        "capital": capitals,
+        "breakeven_return": goalseek.breakeven_return(capitals, billing=billing),
+    })
+
+# Simulated daily returns of the asset classes in ASSET_UNIVERSE and of the benchmark
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_asset_returns(seed=42, years=10, start='2015-01-01'):
+    rng = np.random.default_rng(seed)
+    means, volatilities = (np.array(values) for values in zip(*ASSET_UNIVERSE.values(), BENCHMARK_MOMENTS))
+    correlation = np.block([[np.array(ASSET_CORRELATION), np.array(BENCHMARK_CORRELATION)[:, np.newaxis]],
+                            [np.array(BENCHMARK_CORRELATION), 1.0]])
+    daily_cov = np.outer(volatilities, volatilities) * correlation / TRADING_DAYS_PER_YEAR
+    days = pd.bdate_range(start=start, periods=years * TRADING_DAYS_PER_YEAR)
+    returns = rng.multivariate_normal(means / TRADING_DAYS_PER_YEAR, daily_cov, size=len(days))
+    return pd.DataFrame(returns, index=days, columns=[*ASSET_UNIVERSE, BENCHMARK])
+
+# Daily returns of the holdings (and the portfolio as a whole) and of Nifty 50: the portfolio
+# and benchmark prices when a price source is configured, the simulated asset classes otherwise
+def load_holding_returns():
+    history = load_market_history()
+    if history is None:
+        returns = simulate_asset_returns()
+        holdings = returns[list(MARKET_WEIGHTS)]
+        portfolio = holdings @ (pd.Series(MARKET_WEIGHTS) / 100)
+        return pd.concat([portfolio.rename("Portfolio"), holdings], axis=1), returns[BENCHMARK]
+    daily = data.daily_returns(history)
+    return daily[["Portfolio"]], daily["Nifty 50"]
+
+# Beta, correlation and tracking error of every holding against the benchmark over all windows
+# in one pass; cached per version of the return data
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_benchmark_statistics(holding_returns, benchmark_returns, windows=tuple(BENCHMARK_WINDOWS.values())):
+    return metrics.benchmark_statistics(holding_returns, benchmark_returns, windows,
+                                        periods_per_year=TRADING_DAYS_PER_YEAR)
+
+# Running covariance of the asset classes shared by all sessions; new days are folded in incrementally
+@st.cache_resource(show_spinner=False)
+def get_covariance_estimator():
+    return covariance.CovarianceEstimator(list(ASSET_UNIVERSE))
+
+# Annualized mean returns and covariance of the asset classes, shared by the optimizer and risk sections
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_asset_moments(method='ledoit_wolf'):
+    estimator = get_covariance_estimator()
+    estimator.update(simulate_asset_returns())
+    return (estimator.mean(periods_per_year=TRADING_DAYS_PER_YEAR),
+            estimator.covariance(method, periods_per_year=TRADING_DAYS_PER_YEAR))
+
+# Black-Litterman returns from the market weights and views, and the long-only frontier on them;
+# views are tuples of per-asset coefficients so they can be cache keys
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_allocation_frontier(views, view_returns, confidences, levels=60, method='ledoit_wolf'):
+    _, asset_cov = compute_asset_moments(method)
+    market_weights = np.array([MARKET_WEIGHTS[asset] for asset in asset_cov.index]) / 100
+    expected, posterior_cov = optimizer.black_litterman(asset_cov.to_numpy(), market_weights, views,
+                                                        view_returns, confidences)
+    weights, returns, volatilities = optimizer.efficient_frontier(expected, posterior_cov,
+                                                                  np.geomspace(0.5, 200, levels))
+    frontier = pd.DataFrame(weights, columns=asset_cov.index)
+    frontier["return"], frontier["volatility"] = returns, volatilities
+    implied = optimizer.implied_returns(asset_cov.to_numpy(), market_weights)
+    return (pd.DataFrame({"implied": implied, "black_litterman": expected}, index=asset_cov.index),
+            posterior_cov, frontier)
+
+# Monthly return series used for the ARIMA forecast
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_arima_series(seed=42, periods=12):
+    rng = np.random.RandomState(seed)
+    # Generate random data for monthly returns between -2% and 2%
+    monthly_returns = rng.uniform(-0.02, 0.02, periods)
+    cumulative_returns = (1 + pd.Series(monthly_returns)).cumprod() - 1
+    return cumulative_returns
+
+# Fitted ARIMA models shared by all sessions (statsmodels is imported on first fit)
+@st.cache_resource(show_spinner=False)
+def get_forecaster():
+    return forecasting.ArimaForecaster()
+
+# Figures built from fixed data, built once and shared by all sessions
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    return figures.FigureCache()
+
+# Fee outcomes over a capital x return grid, computed once per billing mode and shared by all sessions
+@st.cache_resource(show_spinner=False)
+def get_fee_grid(billing='annual'):
+    return feegrid.FeeGrid(billing=billing)
+
+# Client ledger (SQLite), created and seeded on first use and shared by all sessions
+@st.cache_resource(show_spinner=False)
+def get_ledger():
+    return ledger.ledger_from_env()
+
+# Current allocation as stress-scenario exposures, one per factor (fractions)
+def allocation_exposures():
+    return np.array([MARKET_WEIGHTS.get(factor, 0) for factor in scenarios.FACTORS]) / 100
+
+# Worst-case outcomes of client portfolios around the current allocation, in percent: every scenario
+# that loses money on the allocation, at WORST_CASE_SEVERITIES, right after the shock, and after the
+# lock-in period of expected growth following it, floored at zero by the capital protection
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def simulate_withdrawal_outcomes(seed=42, n_portfolios=1000, severities=WORST_CASE_SEVERITIES):
+    losing = scenarios.losing_scenarios(scenarios.scenario_frame(), allocation_exposures())
+    shocks = scenarios.scale_scenarios(losing, severities)
+    exposures = scenarios.perturbed_exposures(allocation_exposures(), n_portfolios, seed=seed)
+    stressed = scenarios.stress_returns(exposures, shocks.to_numpy())
+    expected = np.array([ASSET_UNIVERSE[factor][0] for factor in scenarios.FACTORS])
+    growth = (1 + exposures @ expected) ** WITHDRAWAL_LOCK_IN_YEARS
+    protected = np.maximum((1 + stressed) * growth[:, np.newaxis] - 1, 0.0)
+    return (stressed.ravel() * 100).astype(np.float32), (protected.ravel() * 100).astype(np.float32)
+
+# Every scenario as given, with its return on the current allocation
+@st.cache_data(max_entries=SIMULATION_CACHE_ENTRIES, ttl=SIMULATION_CACHE_TTL, show_spinner=False)
+def compute_scenario_table():
+    shocks = scenarios.scenario_frame()
+    table = shocks.copy()
+    table["Current Allocation"] = scenarios.stress_returns(allocation_exposures(), shocks).iloc[0]
+    table["Type"] = np.where(shocks.index.isin(list(scenarios.HISTORICAL_SCENARIOS)), "Historical", "Hypothetical")
+    return table
+
+_PROFILE_FLAG_KEY = "_whalestreet_profile"
+
+
+def start_profiler(started):
+    """Create the section timer of this script run and share it with the page.
+
+    Page switches drop the query string, so ``?profile=1`` is remembered
+    for the rest of the session (``?profile=0`` turns it off again).
+    """
+    requested = st.query_params.get(profiling.QUERY_PARAM)
+    if requested is not None:
+        st.session_state[_PROFILE_FLAG_KEY] = profiling.is_enabled(requested, environ={})
+    enabled = st.session_state.get(_PROFILE_FLAG_KEY, False) or profiling.is_enabled()
+    timer = profiling.SectionTimer(enabled=enabled, started=started)
+    st.session_state[_PROFILER_KEY] = timer
+    return timer
+
+
+def profiler():
+    """The section timer of the current run (a disabled one outside the app)."""
+    timer = st.session_state.get(_PROFILER_KEY)
+    return timer if timer is not None else profiling.SectionTimer(enabled=False)
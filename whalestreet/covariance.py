@@ -0,0 +1,148 @@
+"""Covariance of asset returns, updated incrementally.
+
+``CovarianceEstimator`` keeps running sums of the returns it has seen
+instead of the returns themselves, so folding in a new day (or a batch of
+days) costs products over the new rows only, however long the history,
+and memory does not grow with it. From the sums it gives
+
+* the sample covariance,
+* the Ledoit-Wolf estimate, which shrinks the sample covariance towards a
+  scaled identity by the intensity that minimizes the expected error; with
+  hundreds of stocks and a few years of days the sample matrix is noisy
+  and badly conditioned, the shrunk one is not,
+* the exponentially weighted (RiskMetrics) covariance, which follows
+  changing volatility.
+
+The sums are kept in float64 on returns shifted by the mean of the first
+batch, which avoids the cancellation of textbook one-pass formulas.
+Estimates come out in the estimator's ``dtype``; ``float32`` halves the
+memory of every matrix handed out and cached.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+METHODS = ("sample", "ledoit_wolf", "ewma")
+DEFAULT_DECAY = 0.94  # RiskMetrics decay factor for daily returns
+
+
+class CovarianceEstimator:
+    """Running sample, Ledoit-Wolf and EWMA covariance of a fixed set of assets.
+
+    Safe to share between Streamlit sessions. ``decay`` is the weight the
+    EWMA estimate gives the previous day's estimate; ``dtype`` is the
+    dtype of the estimates it returns.
+    """
+
+    def __init__(self, assets, decay=DEFAULT_DECAY, dtype=np.float64):
+        self.assets = list(assets)
+        self.decay = decay
+        self.dtype = np.dtype(dtype)
+        self.end = None  # index label of the last DataFrame row folded in
+        self._lock = threading.Lock()
+        n = len(self.assets)
+        self._count = 0
+        self._shift = np.zeros(n)
+        self._sum = np.zeros(n)  # sum of shifted returns y
+        self._cross = np.zeros((n, n))  # sum of y y'
+        self._norm_sum = np.zeros(n)  # sum of |y|^2 y
+        self._norm_square = 0.0  # sum of |y|^4
+        self._ewma = np.zeros((n, n))  # exponentially weighted sum of r r'
+
+    @property
+    def count(self):
+        return self._count
+
+    def update(self, returns):
+        """Fold in new rows of ``(days, assets)`` returns; returns how many rows were used.
+
+        A DataFrame is aligned on ``assets`` and, once the estimator has
+        seen one, only its rows indexed after the last row seen are used,
+        so passing the whole history again folds in just the new days.
+        """
+        with self._lock:
+            if isinstance(returns, pd.DataFrame):
+                returns = returns[self.assets]
+                if self.end is not None:
+                    returns = returns[returns.index > self.end]
+                if len(returns):
+                    self.end = returns.index[-1]
+            values = np.asarray(returns, dtype=float).reshape(-1, len(self.assets))
+            if not len(values):
+                return 0
+
+            if not self._count:
+                self._shift = values.mean(axis=0)
+            shifted = values - self._shift
+            norms = np.einsum("ij,ij->i", shifted, shifted)
+            self._count += len(values)
+            self._sum += shifted.sum(axis=0)
+            self._cross += shifted.T @ shifted
+            self._norm_sum += norms @ shifted
+            self._norm_square += norms @ norms
+            # Each day of the batch is discounted once for every later day
+            weights = (1 - self.decay) * self.decay ** np.arange(len(values) - 1, -1, -1)
+            self._ewma = self.decay ** len(values) * self._ewma + (values * weights[:, np.newaxis]).T @ values
+            return len(values)
+
+    def _frame(self, matrix, periods_per_year):
+        return pd.DataFrame((matrix * periods_per_year).astype(self.dtype), index=self.assets, columns=self.assets)
+
+    def _centered(self):
+        # Mean of the shifted returns and the scatter matrix sum (y - mean)(y - mean)'
+        if not self._count:
+            raise ValueError("no returns have been added yet")
+        mean = self._sum / self._count
+        return mean, self._cross - self._count * np.outer(mean, mean)
+
+    def mean(self, periods_per_year=1):
+        with self._lock:
+            mean, _ = self._centered()
+            return pd.Series(((self._shift + mean) * periods_per_year).astype(self.dtype), index=self.assets)
+
+    def sample(self, ddof=1, periods_per_year=1):
+        """Sample covariance."""
+        with self._lock:
+            _, scatter = self._centered()
+            return self._frame(scatter / (self._count - ddof), periods_per_year)
+
+    def ledoit_wolf_shrinkage(self):
+        """Shrunk covariance matrix (as an array) and the shrinkage intensity in ``[0, 1]``."""
+        with self._lock:
+            mean, scatter = self._centered()
+            count, n = self._count, len(self.assets)
+            cov = scatter / count
+            target = np.trace(cov) / n
+            dispersion = (np.sum(cov * cov) - 2 * target * np.trace(cov) + n * target ** 2) / n
+            # Sum over days of |x - mean|^4, expanded in the running sums
+            mean_norm = mean @ mean
+            fourth = (self._norm_square - 4 * mean @ self._norm_sum + 4 * mean @ self._cross @ mean
+                      + 2 * mean_norm * np.trace(self._cross) - 4 * mean_norm * (mean @ self._sum)
+                      + count * mean_norm ** 2)
+            # Estimation error of the sample covariance, capped by the dispersion around the target
+            error = min((fourth - count * np.sum(cov * cov)) / count ** 2 / n, dispersion)
+            shrinkage = error / dispersion if dispersion > 0 else 0.0
+        return shrinkage * target * np.eye(n) + (1 - shrinkage) * cov, shrinkage
+
+    def ledoit_wolf(self, periods_per_year=1):
+        """Ledoit-Wolf covariance, shrunk towards the average variance times the identity."""
+        matrix, _ = self.ledoit_wolf_shrinkage()
+        return self._frame(matrix, periods_per_year)
+
+    def ewma(self, periods_per_year=1):
+        """Exponentially weighted covariance (zero mean, normalized by the total weight)."""
+        with self._lock:
+            if not self._count:
+                raise ValueError("no returns have been added yet")
+            return self._frame(self._ewma / (1 - self.decay ** self._count), periods_per_year)
+
+    def covariance(self, method="sample", periods_per_year=1):
+        """Covariance estimate by name, one of ``METHODS``."""
+        if method == "sample":
+            return self.sample(periods_per_year=periods_per_year)
+        if method == "ledoit_wolf":
+            return self.ledoit_wolf(periods_per_year)
+        if method == "ewma":
+            return self.ewma(periods_per_year)
+        raise ValueError(f"unknown covariance method {method!r}")
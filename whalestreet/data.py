@@ -0,0 +1,220 @@
+"""Price history for the portfolio and its benchmark.
+
+A ``PriceSource`` returns daily closing prices for a symbol between two
+dates: ``YFinanceSource`` downloads them, ``FileSource`` reads CSV or
+Parquet files from a directory and serves as an offline stand-in.
+``PriceStore`` wraps a source with an on-disk Parquet cache per symbol and
+only asks the source for the dates the cache does not cover yet, so a
+daily refresh downloads a few rows instead of the whole history.
+
+The dashboard picks its source from the environment (see
+:func:`store_from_env`); without configuration it keeps using simulated
+data.
+"""
+import os
+import re
+
+import pandas as pd
+
+SOURCE_ENV = "WHALESTREET_PRICE_SOURCE"
+DATA_DIR_ENV = "WHALESTREET_DATA_DIR"
+CACHE_DIR_ENV = "WHALESTREET_CACHE_DIR"
+PORTFOLIO_SYMBOL_ENV = "WHALESTREET_PORTFOLIO_SYMBOL"
+BENCHMARK_SYMBOL_ENV = "WHALESTREET_BENCHMARK_SYMBOL"
+
+DEFAULT_DATA_DIR = "data"
+DEFAULT_CACHE_DIR = os.path.join(".cache", "prices")
+DEFAULT_PORTFOLIO_SYMBOL = "PORTFOLIO"
+DEFAULT_BENCHMARK_SYMBOL = "^NSEI"  # Nifty 50
+
+# Preferred price column, in order, when a file or download has several
+PRICE_COLUMNS = ("Adj Close", "Close", "close", "price", "Price")
+
+_ONE_DAY = pd.Timedelta(days=1)
+
+
+def file_stem(symbol):
+    """File-system safe name for a symbol (``"^NSEI"`` -> ``"NSEI"``)."""
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", symbol).strip("_") or "_"
+
+
+def _price_series(frame, symbol):
+    # Pick the closing price column and normalize to a sorted, date-indexed float Series
+    if isinstance(frame, pd.DataFrame):
+        column = next((c for c in PRICE_COLUMNS if c in frame.columns), None)
+        if column is None and frame.shape[1] == 1:
+            column = frame.columns[0]
+        if column is None:
+            raise ValueError(f"no price column for {symbol!r} in {list(frame.columns)}")
+        frame = frame[column]
+        if isinstance(frame, pd.DataFrame):  # yfinance labels columns by (field, ticker)
+            frame = frame.iloc[:, 0]
+    prices = pd.Series(frame, dtype=float, name=symbol).dropna()
+    prices.index = pd.DatetimeIndex(prices.index).tz_localize(None).normalize()
+    prices.index.name = "date"
+    return prices[~prices.index.duplicated(keep="last")].sort_index()
+
+
+class PriceSource:
+    """Daily closing prices for a symbol; subclasses implement :meth:`fetch`."""
+
+    def fetch(self, symbol, start, end):
+        """Closing prices for ``symbol`` from ``start`` to ``end`` (both inclusive)."""
+        raise NotImplementedError
+
+
+class YFinanceSource(PriceSource):
+    """Adjusted closes downloaded from Yahoo Finance."""
+
+    def fetch(self, symbol, start, end):
+        import yfinance as yf
+
+        # yfinance treats ``end`` as exclusive
+        frame = yf.download(symbol, start=start, end=pd.Timestamp(end) + _ONE_DAY,
+                            auto_adjust=True, progress=False)
+        if frame is None or frame.empty:
+            return _price_series(pd.Series(dtype=float), symbol)
+        return _price_series(frame, symbol).loc[start:end]
+
+
+class FileSource(PriceSource):
+    """Prices read from ``<directory>/<symbol>.parquet`` or ``.csv``.
+
+    Files hold a date column (the index for Parquet, the first column for
+    CSV) and a closing price column such as ``Close`` or ``Adj Close``.
+    """
+
+    def __init__(self, directory=DEFAULT_DATA_DIR):
+        self.directory = directory
+
+    def fetch(self, symbol, start, end):
+        stem = os.path.join(self.directory, file_stem(symbol))
+        if os.path.exists(stem + ".parquet"):
+            frame = pd.read_parquet(stem + ".parquet")
+        elif os.path.exists(stem + ".csv"):
+            frame = pd.read_csv(stem + ".csv", index_col=0, parse_dates=True)
+        else:
+            raise FileNotFoundError(f"no {stem}.parquet or {stem}.csv for {symbol!r}")
+        return _price_series(frame, symbol).loc[start:end]
+
+
+class PriceStore:
+    """A price source with an incremental on-disk Parquet cache.
+
+    Each symbol is cached in ``<cache_dir>/<symbol>.parquet`` together with
+    the date range already requested from the source, so dates the source
+    has no prices for (weekends, holidays, before listing) are not asked
+    for again. Each request for a gap also asks for the nearest cached
+    close: an answer holding only that close means the gap has no prices
+    and counts as covered, while an empty answer (e.g. while offline) does
+    not.
+    """
+
+    def __init__(self, source, cache_dir=DEFAULT_CACHE_DIR):
+        self.source = source
+        self.cache_dir = cache_dir
+        self.fetches = 0
+
+    def cache_path(self, symbol):
+        return os.path.join(self.cache_dir, file_stem(symbol) + ".parquet")
+
+    def _read_cache(self, symbol):
+        path = self.cache_path(symbol)
+        if not os.path.exists(path):
+            return _price_series(pd.Series(dtype=float), symbol), None
+        frame = pd.read_parquet(path)
+        covered = frame.attrs.get("covered")
+        covered = tuple(pd.Timestamp(day) for day in covered) if covered else None
+        return _price_series(frame, symbol), covered
+
+    def _write_cache(self, symbol, prices, covered):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        frame = prices.rename("close").to_frame()
+        frame.attrs["covered"] = [day.strftime("%Y-%m-%d") for day in covered]
+        # Write then rename so a concurrent reader never sees a partial file
+        path = self.cache_path(symbol)
+        frame.to_parquet(path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    def history(self, symbol, start, end=None):
+        """Daily closes for ``symbol`` from ``start`` to ``end`` (default: today)."""
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end if end is not None else "today").normalize()
+        cached, covered = self._read_cache(symbol)
+
+        if covered is None:
+            missing = [(start, end)]
+        else:
+            missing = []
+            if start < covered[0]:
+                missing.append((start, covered[0] - _ONE_DAY))
+            if end > covered[1]:
+                missing.append((covered[1] + _ONE_DAY, end))
+
+        fetched = []
+        was_covered = covered
+        for gap_start, gap_end in missing:
+            if not len(cached):
+                piece = self.source.fetch(symbol, gap_start, gap_end)
+            elif gap_start > cached.index[-1]:
+                piece = self.source.fetch(symbol, cached.index[-1], gap_end)
+            else:
+                piece = self.source.fetch(symbol, gap_start, cached.index[0])
+            self.fetches += 1
+            if piece.empty:
+                # Failed or not yet available: leave the gap to be asked for again
+                continue
+            fetched.append(piece.loc[gap_start:gap_end])
+            # Today's close is not final, so it is never marked as covered
+            gap_end = min(gap_end, pd.Timestamp("today").normalize() - _ONE_DAY)
+            if gap_start <= gap_end:
+                covered = (min(gap_start, covered[0]), max(gap_end, covered[1])) if covered else (gap_start, gap_end)
+
+        if covered != was_covered:
+            cached = _price_series(pd.concat([cached, *fetched]) if len(cached) else pd.concat(fetched), symbol)
+            self._write_cache(symbol, cached, covered)
+        return cached.loc[start:end]
+
+
+SOURCES = {
+    "yfinance": YFinanceSource,
+    "files": FileSource,
+}
+
+
+def store_from_env(environ=None):
+    """The configured ``PriceStore``, or ``None`` to use simulated data.
+
+    ``WHALESTREET_PRICE_SOURCE`` selects ``yfinance`` or ``files`` (prices
+    read from ``WHALESTREET_DATA_DIR``); anything else, or unset, means
+    simulated data. The cache lives in ``WHALESTREET_CACHE_DIR``.
+    """
+    environ = os.environ if environ is None else environ
+    name = environ.get(SOURCE_ENV, "").strip().lower()
+    if name not in SOURCES:
+        return None
+    if name == "files":
+        source = FileSource(environ.get(DATA_DIR_ENV, DEFAULT_DATA_DIR))
+    else:
+        source = SOURCES[name]()
+    return PriceStore(source, environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+
+def configured_symbols(environ=None):
+    """``(portfolio, benchmark)`` symbols, overridable from the environment."""
+    environ = os.environ if environ is None else environ
+    return (environ.get(PORTFOLIO_SYMBOL_ENV, DEFAULT_PORTFOLIO_SYMBOL),
+            environ.get(BENCHMARK_SYMBOL_ENV, DEFAULT_BENCHMARK_SYMBOL))
+
+
+def monthly_returns(prices):
+    """Month-over-month returns from daily prices, indexed by month end."""
+    month_end = prices.groupby(prices.index.to_period("M")).last()
+    returns = month_end.pct_change().iloc[1:]
+    returns.index = returns.index.to_timestamp(how="end").normalize()
+    return returns
+
+
+def daily_returns(prices):
+    """Day-over-day returns from daily prices."""
+    return prices.pct_change().iloc[1:]
@@ -0,0 +1,102 @@
+"""Precomputed fee outcomes for interactive what-if inputs.
+
+``FeeGrid`` runs the fee engine once for every combination of initial
+capital, annual return and revenue model on a grid, and keeps the yearly
+net capital as a compact ``float32`` array. Looking up an input between
+grid points is a bilinear interpolation, which takes microseconds instead
+of a schedule recompute, and the same array drives sensitivity heatmaps.
+
+Net capital is stored as a multiple of the initial capital. Within a
+management fee bracket that multiple does not depend on the capital, so
+interpolating along the capital axis is exact; the grid has nodes on both
+sides of the bracket limit so no cell straddles it. Along the return axis
+the default 0.1% step matches the dashboard input, whose values then fall
+on grid nodes.
+"""
+import numpy as np
+
+from whalestreet import fees
+
+MODELS = ("complex", "simple")
+DEFAULT_YEARS = 5
+
+# Capital from ₹1 lakh to ₹10 crore, returns from -10% to 100% a year in 0.1% steps
+DEFAULT_CAPITALS = np.geomspace(1e5, 1e8, 31)
+DEFAULT_RETURNS = np.round(np.arange(-0.10, 1.0 + 1e-9, 0.001), 4)
+
+
+def _capital_axis(capitals):
+    # Nodes on both sides of the management fee limit keep every cell inside one bracket
+    limit = float(fees.MANAGEMENT_FEE_CAPITAL_LIMIT)
+    capitals = np.r_[np.asarray(capitals, dtype=float), limit, np.nextafter(limit, np.inf)]
+    return np.unique(capitals)
+
+
+def _cell(axis, values):
+    # Index of the lower node and the weight of the upper node for each value
+    index = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, len(axis) - 2)
+    weight = (values - axis[index]) / (axis[index + 1] - axis[index])
+    return index, weight
+
+
+class FeeGrid:
+    """Yearly net capital of both revenue models over a capital x return grid.
+
+    ``capitals`` are initial capitals in rupees and ``returns`` constant
+    annual returns as fractions; ``billing`` is how Model 1 charges its
+    management fee (see ``fees.BILLING``). ``multiples`` has shape
+    ``(models, capitals, returns, years)`` and holds the net capital at the
+    end of each year divided by the initial capital.
+    """
+
+    def __init__(self, capitals=DEFAULT_CAPITALS, returns=DEFAULT_RETURNS, years=DEFAULT_YEARS,
+                 billing='annual'):
+        self.capitals = _capital_axis(capitals)
+        self.returns = np.unique(np.asarray(returns, dtype=float))
+        self.years = years
+        self.billing = billing
+
+        # Every grid point is one client of a single batched run per model
+        capital = np.repeat(self.capitals, len(self.returns))
+        paths = np.repeat(np.tile(self.returns, len(self.capitals))[:, np.newaxis], years, axis=1)
+        schedules = fees.fee_schedules(capital, paths, billing=billing)
+        shape = (len(self.capitals), len(self.returns), years)
+        self.multiples = np.stack([
+            (schedules[model]["net_capital"] / capital[:, np.newaxis]).reshape(shape)
+            for model in MODELS
+        ]).astype(np.float32)
+
+    @property
+    def nbytes(self):
+        return self.multiples.nbytes
+
+    def covers(self, initial_capital, annual_return):
+        """Whether the inputs lie inside the grid (outside it lookups are NaN)."""
+        capital = np.asarray(initial_capital, dtype=float)
+        annual_return = np.asarray(annual_return, dtype=float)
+        return ((capital >= self.capitals[0]) & (capital <= self.capitals[-1])
+                & (annual_return >= self.returns[0]) & (annual_return <= self.returns[-1]))
+
+    def net_capital(self, model, initial_capital, annual_return):
+        """Interpolated net capital at the end of each year.
+
+        ``initial_capital`` and ``annual_return`` broadcast against each
+        other; the result has their broadcast shape plus a trailing year
+        axis. Inputs outside the grid give NaN.
+        """
+        table = self.multiples[MODELS.index(model)]
+        capital, annual_return = np.broadcast_arrays(np.asarray(initial_capital, dtype=float),
+                                                     np.asarray(annual_return, dtype=float))
+        i, u = _cell(self.capitals, capital)
+        j, v = _cell(self.returns, annual_return)
+        u, v = u[..., np.newaxis], v[..., np.newaxis]
+        multiple = ((1 - u) * (1 - v) * table[i, j] + (1 - u) * v * table[i, j + 1]
+                    + u * (1 - v) * table[i + 1, j] + u * v * table[i + 1, j + 1])
+        inside = self.covers(capital, annual_return)[..., np.newaxis]
+        return np.where(inside, multiple * capital[..., np.newaxis], np.nan)
+
+    def final_multiples(self, model, capitals, returns):
+        """``(capitals, returns)`` matrix of final net capital per rupee invested."""
+        capitals = np.asarray(capitals, dtype=float)
+        final = self.net_capital(model, capitals[:, np.newaxis], np.asarray(returns, dtype=float)[np.newaxis, :])
+        return final[..., -1] / capitals[:, np.newaxis]
@@ -0,0 +1,252 @@
+"""Vectorized fee engine for the two revenue sharing models.
+
+Every function works on a batch of clients at once: ``initial_capital`` is a
+scalar or a ``(clients,)`` array and ``returns`` is a ``(clients, years)``
+matrix of annual returns as fractions (a 1-D path is broadcast to every
+client). Capital compounds year over year, so the engine steps through the
+short year axis and does all the work for every client in one NumPy
+operation per year.
+"""
+import numpy as np
+import pandas as pd
+
+# Model 1: management fee on capital plus profit share above a hurdle
+MANAGEMENT_FEE_CAPITAL_LIMIT = 300000
+LOW_CAPITAL_MANAGEMENT_FEE = 5.0  # % for capital up to the limit
+HIGH_CAPITAL_MANAGEMENT_FEE = 4.0  # % for capital above the limit
+COMPLEX_PROFIT_SHARE = 20.0  # % of profits above the hurdle
+COMPLEX_HURDLE = 6.0  # % return on capital before profit sharing starts
+
+# Model 2: flat profit share on the yearly profit over the threshold capital
+SIMPLE_PROFIT_SHARE = 30.0
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# How Model 1's management fee is charged: once at year end, or 1/12 of it every month
+BILLING = ('annual', 'monthly')
+MONTHS_PER_YEAR = 12
+
+
+def _as_batch(initial_capital, returns):
+    capital = np.atleast_1d(np.asarray(initial_capital, dtype=float))
+    returns = np.asarray(returns, dtype=float)
+    if returns.ndim == 1:
+        returns = returns[np.newaxis, :]
+    clients = np.broadcast_shapes(capital.shape, returns.shape[:1])[0]
+    capital = np.broadcast_to(capital, (clients,))
+    returns = np.broadcast_to(returns, (clients, returns.shape[1]))
+    return capital, returns
+
+
+def management_fee_rate(initial_capital):
+    """Management fee percentage for each client's initial capital."""
+    capital = np.asarray(initial_capital, dtype=float)
+    return np.where(capital <= MANAGEMENT_FEE_CAPITAL_LIMIT,
+                    LOW_CAPITAL_MANAGEMENT_FEE, HIGH_CAPITAL_MANAGEMENT_FEE)
+
+
+def complex_model(initial_capital, returns,
+                  profit_share_percentage=COMPLEX_PROFIT_SHARE,
+                  hurdle_percentage=COMPLEX_HURDLE):
+    """Yearly schedule for Model 1 (management fee + profit share above hurdle).
+
+    Returns a dict of ``(clients, years)`` float arrays: ``start_capital``,
+    ``total_capital``, ``management_fee``, ``profit_share`` and
+    ``net_capital``, plus the per-client ``management_fee_percentage``.
+    """
+    capital, returns = _as_batch(initial_capital, returns)
+    fee_percentage = management_fee_rate(capital)
+    schedule = {name: np.empty(returns.shape) for name in
+                ('start_capital', 'total_capital', 'management_fee',
+                 'profit_share', 'net_capital')}
+
+    current = capital
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for year in range(returns.shape[1]):
+            total_return_value = current * returns[:, year]
+            total_capital = current + total_return_value
+            management_fee = current * (fee_percentage / 100)
+
+            # Profit share only applies once the yearly return clears the hurdle
+            above_hurdle = total_return_value / current * 100 > hurdle_percentage
+            profit_share = np.where(
+                above_hurdle,
+                profit_share_percentage / 100 * (total_return_value - (hurdle_percentage / 100 * current)),
+                0.0,
+            )
+            net_capital = total_capital - management_fee - profit_share
+
+            schedule['start_capital'][:, year] = current
+            schedule['total_capital'][:, year] = total_capital
+            schedule['management_fee'][:, year] = management_fee
+            schedule['profit_share'][:, year] = profit_share
+            schedule['net_capital'][:, year] = net_capital
+            current = net_capital
+
+    schedule['management_fee_percentage'] = fee_percentage
+    return schedule
+
+
+def monthly_returns_from_annual(returns):
+    """Constant monthly returns compounding to each annual return.
+
+    ``returns`` has years on its last axis; the result has ``12 * years``
+    months there.
+    """
+    returns = np.asarray(returns, dtype=float)
+    return np.repeat(np.power(1 + returns, 1 / MONTHS_PER_YEAR) - 1, MONTHS_PER_YEAR, axis=-1)
+
+
+def complex_model_monthly(initial_capital, monthly_returns,
+                          profit_share_percentage=COMPLEX_PROFIT_SHARE,
+                          hurdle_percentage=COMPLEX_HURDLE):
+    """Yearly schedule for Model 1 with the management fee deducted monthly.
+
+    ``monthly_returns`` is a ``(clients, months)`` matrix covering whole
+    years. The annual management fee is set on the capital at the start of
+    each year and 1/12 of it is deducted at the end of every month, after
+    that month's return, so the rest of the year compounds on the reduced
+    capital. The profit share crystallizes at year end on the year's return
+    before fees, as in :func:`complex_model`. Returns the same dict as
+    :func:`complex_model`.
+    """
+    capital, monthly_returns = _as_batch(initial_capital, monthly_returns)
+    if monthly_returns.shape[1] % MONTHS_PER_YEAR:
+        raise ValueError(f"monthly returns must cover whole years, got {monthly_returns.shape[1]} months")
+    years = monthly_returns.shape[1] // MONTHS_PER_YEAR
+    fee_percentage = management_fee_rate(capital)
+    schedule = {name: np.empty((len(capital), years)) for name in
+                ('start_capital', 'total_capital', 'management_fee',
+                 'profit_share', 'net_capital')}
+
+    current = capital
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for year in range(years):
+            management_fee = current * (fee_percentage / 100)
+            value = current
+            for month in range(year * MONTHS_PER_YEAR, (year + 1) * MONTHS_PER_YEAR):
+                value = value * (1 + monthly_returns[:, month]) - management_fee / MONTHS_PER_YEAR
+
+            # Return generated over the year before fees, which the hurdle applies to
+            total_return_value = value + management_fee - current
+            total_capital = current + total_return_value
+            above_hurdle = total_return_value / current * 100 > hurdle_percentage
+            profit_share = np.where(
+                above_hurdle,
+                profit_share_percentage / 100 * (total_return_value - (hurdle_percentage / 100 * current)),
+                0.0,
+            )
+            net_capital = value - profit_share
+
+            schedule['start_capital'][:, year] = current
+            schedule['total_capital'][:, year] = total_capital
+            schedule['management_fee'][:, year] = management_fee
+            schedule['profit_share'][:, year] = profit_share
+            schedule['net_capital'][:, year] = net_capital
+            current = net_capital
+
+    schedule['management_fee_percentage'] = fee_percentage
+    return schedule
+
+
+def simple_model(initial_capital, returns,
+                 profit_share_percentage=SIMPLE_PROFIT_SHARE,
+                 high_water_mark=False, floor_profit_share=False):
+    """Yearly schedule for Model 2 (flat profit share over the threshold).
+
+    The threshold is the initial capital in year 1 and the previous year's
+    net capital (in whole rupees) afterwards. With ``high_water_mark`` the
+    threshold is instead the highest net capital reached so far: after a
+    losing year no profit is shared until the loss has been recovered, and
+    the profit share is never negative. Without it a losing year gives a
+    negative profit share unless ``floor_profit_share`` is set. Returns a
+    dict of ``(clients, years)`` float arrays: ``threshold``,
+    ``total_profit``, ``profit_share``, ``total_capital`` and
+    ``net_capital``.
+    """
+    capital, returns = _as_batch(initial_capital, returns)
+    schedule = {name: np.empty(returns.shape) for name in
+                ('threshold', 'total_profit', 'profit_share',
+                 'total_capital', 'net_capital')}
+
+    current = threshold = capital
+    for year in range(returns.shape[1]):
+        total_profit = current * returns[:, year]
+        total_capital = current + total_profit
+        if high_water_mark:
+            profit_share = profit_share_percentage / 100 * np.maximum(total_capital - threshold, 0.0)
+        else:
+            shared = np.maximum(total_profit, 0.0) if floor_profit_share else total_profit
+            profit_share = profit_share_percentage / 100 * shared
+        net_capital = total_capital - profit_share
+
+        schedule['threshold'][:, year] = threshold
+        schedule['total_profit'][:, year] = total_profit
+        schedule['profit_share'][:, year] = profit_share
+        schedule['total_capital'][:, year] = total_capital
+        schedule['net_capital'][:, year] = net_capital
+        # Net capital is settled in whole rupees before it becomes the next threshold
+        current = np.trunc(net_capital)
+        threshold = np.maximum(threshold, current) if high_water_mark else current
+
+    return schedule
+
+
+def complex_schedule(initial_capital, returns, billing='annual'):
+    """Model 1 schedule from annual returns, the fee charged per ``billing``."""
+    if billing == 'annual':
+        return complex_model(initial_capital, returns)
+    if billing == 'monthly':
+        return complex_model_monthly(initial_capital, monthly_returns_from_annual(returns))
+    raise ValueError(f"unknown billing {billing!r}, expected one of {BILLING}")
+
+
+def fee_schedules(initial_capital, returns, billing='annual'):
+    """Both model schedules for a batch of clients in one call."""
+    return {
+        'complex': complex_schedule(initial_capital, returns, billing),
+        'simple': simple_model(initial_capital, returns),
+    }
+
+
+def fee_bands(initial_capital, returns, percentiles=DEFAULT_PERCENTILES, high_water_mark=True,
+              billing='annual'):
+    """Percentile bands of both models over a batch of return paths.
+
+    ``returns`` is a ``(paths, years)`` matrix of annual returns, every
+    path starting from the same ``initial_capital``. Returns a DataFrame
+    indexed by ``(model, measure, year)`` with one column per percentile
+    (``p5``, ``p50``...) and a ``mean`` column. The measures are
+    ``net_capital`` and the cumulative ``management_fee`` and
+    ``profit_share`` paid up to each year. ``billing`` selects how Model 1
+    charges its management fee (see :func:`complex_model_monthly`); Model 2
+    uses a high-water mark unless ``high_water_mark`` is False, and never
+    shares a loss either way.
+    """
+    complex_result = complex_schedule(initial_capital, returns, billing)
+    simple_result = simple_model(initial_capital, returns, high_water_mark=high_water_mark,
+                                 floor_profit_share=True)
+    measures = {
+        ('complex', 'net_capital'): complex_result['net_capital'],
+        ('complex', 'management_fee'): np.cumsum(complex_result['management_fee'], axis=1),
+        ('complex', 'profit_share'): np.cumsum(complex_result['profit_share'], axis=1),
+        ('simple', 'net_capital'): simple_result['net_capital'],
+        ('simple', 'management_fee'): np.zeros_like(simple_result['net_capital']),
+        ('simple', 'profit_share'): np.cumsum(simple_result['profit_share'], axis=1),
+    }
+
+    years = np.arange(1, np.shape(returns)[-1] + 1)
+    frames = []
+    for (model, measure), values in measures.items():
+        frame = pd.DataFrame(np.percentile(values, percentiles, axis=0).T,
+                             columns=[f'p{p:g}' for p in percentiles])
+        frame['mean'] = values.mean(axis=0)
+        frame.index = pd.MultiIndex.from_product([[model], [measure], years],
+                                                 names=['model', 'measure', 'year'])
+        frames.append(frame)
+    return pd.concat(frames).sort_index()
+
+
+def to_rupees(values):
+    """Truncate amounts to whole rupees the way the yearly tables display them."""
+    return np.trunc(values).astype(np.int64)
@@ -0,0 +1,92 @@
+"""Cache of Plotly figures drawn from fixed data.
+
+Many dashboard charts are built from hard-coded numbers, yet building a
+figure (especially through ``plotly.express``) costs tens of milliseconds
+per rerun. ``FigureCache`` builds each figure once per combination of
+chart name, data and theme and keeps it in a bounded LRU cache shared by
+all sessions. Changing the data or the theme gives a new key, so a stale
+figure is never served.
+
+The cache holds Figure objects rather than their JSON: ``st.plotly_chart``
+validates dict or JSON input by rebuilding a Figure from it, which costs
+about as much as building the chart in the first place. Cached figures are
+shared and must not be modified by callers; per-rerun additions such as a
+marker at the user's inputs go into the data, so the cached figure is final.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_FIGURES = 64
+
+
+def _feed(hasher, value):
+    # Hash values by content, keeping the order of sequences and mappings
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = value.columns if isinstance(value, pd.DataFrame) else value.name
+        hasher.update(repr(labels).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"{value.dtype}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b"{")
+        for key, item in value.items():
+            _feed(hasher, key)
+            _feed(hasher, item)
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _feed(hasher, item)
+        hasher.update(b"]")
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+def data_key(value):
+    """Content hash of chart data (pandas, numpy, containers or scalars)."""
+    hasher = hashlib.sha1()
+    _feed(hasher, value)
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """Build-once cache of Plotly figures, safe to share between sessions.
+
+    Holds at most ``max_figures`` entries and evicts the least recently
+    used one when full.
+    """
+
+    def __init__(self, max_figures=DEFAULT_MAX_FIGURES):
+        self.max_figures = max_figures
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def figure(self, name, build, data, theme=None):
+        """The figure ``build(data, theme)``, built on first use only."""
+        key = (name, data_key(data), data_key(theme))
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return figure
+
+        figure = build(data, theme)
+        with self._lock:
+            self.builds += 1
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_figures:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,226 @@
+"""ARIMA forecasting with memoized fits.
+
+Fitting an ARIMA model is by far the slowest step of the Growth
+Projections page, while the series it is fitted on rarely changes. The
+forecaster keeps the fitted results of recent series (keyed by a hash of
+the series and the model order) and, when a series is an older one with new
+observations appended, starts the optimizer from the previous parameters.
+statsmodels is imported on first fit so importing this module stays cheap.
+
+``forecast_many`` fits many client series in one job on a process pool,
+picking the best order from a grid for each series by AIC.
+"""
+import hashlib
+import itertools
+import signal
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_ORDER = (1, 1, 1)
+DEFAULT_MAX_MODELS = 32
+DEFAULT_SERIES_TIMEOUT = 30.0  # seconds
+
+BATCH_COLUMNS = ["series", "order", "aic", "step", "date", "mean", "lower", "upper", "error"]
+
+
+def series_key(series, order):
+    """Stable cache key for a series (values and index) and a model order."""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(series, index=True).values.tobytes()).hexdigest()
+    return digest, tuple(order)
+
+
+def forecast_frame(results, steps=1, alpha=0.05):
+    """Mean forecast and confidence bounds for the next ``steps`` periods."""
+    forecast = results.get_forecast(steps=steps)
+    conf_int = forecast.conf_int(alpha=alpha)
+    return pd.DataFrame({
+        "mean": np.asarray(forecast.predicted_mean),
+        "lower": conf_int.iloc[:, 0].values,
+        "upper": conf_int.iloc[:, 1].values,
+    }, index=forecast.predicted_mean.index)
+
+
+class ArimaForecaster:
+    """Memoizing ARIMA fitter, safe to share between Streamlit sessions.
+
+    Holds at most ``max_models`` fitted results and evicts the least
+    recently used one when full.
+    """
+
+    def __init__(self, max_models=DEFAULT_MAX_MODELS):
+        self.max_models = max_models
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.warm_starts = 0
+        self.fits = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            results = self._models.get(key)
+            if results is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+            return results
+
+    def _warm_start_params(self, values, order):
+        # Parameters of the longest cached fit whose series is a prefix of this one
+        best = None
+        with self._lock:
+            for (_, cached_order), results in self._models.items():
+                if cached_order != tuple(order):
+                    continue
+                cached = np.asarray(results.model.endog).ravel()
+                if len(cached) < len(values) and np.array_equal(cached, values[:len(cached)]):
+                    if best is None or len(cached) > len(best[0]):
+                        best = (cached, results.params)
+        return None if best is None else best[1]
+
+    def fit(self, series, order=DEFAULT_ORDER):
+        """Fitted ARIMA results for ``series``, reusing earlier work when possible."""
+        from statsmodels.tsa.arima.model import ARIMA
+
+        series = pd.Series(series)
+        key = series_key(series, order)
+        results = self._lookup(key)
+        if results is not None:
+            return results
+
+        start_params = self._warm_start_params(series.to_numpy(dtype=float), order)
+        results = ARIMA(series, order=tuple(order)).fit(start_params=start_params)
+        with self._lock:
+            self.fits += 1
+            self.warm_starts += start_params is not None
+            self._models[key] = results
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+        return results
+
+    def forecast(self, series, steps=1, order=DEFAULT_ORDER, alpha=0.05):
+        """Multi-step forecast of ``series`` as a ``mean``/``lower``/``upper`` DataFrame."""
+        return forecast_frame(self.fit(series, order), steps=steps, alpha=alpha)
+
+
+def order_grid(p=(0, 1, 2), d=(1,), q=(0, 1, 2)):
+    """All ``(p, d, q)`` combinations, for use as ``forecast_many(orders=...)``."""
+    return list(itertools.product(p, d, q))
+
+
+class SeriesTimeout(Exception):
+    """Raised inside a worker when a series exceeds its time budget."""
+
+
+def _raise_timeout(signum, frame):
+    raise SeriesTimeout()
+
+
+def _error_rows(name, message):
+    return [dict.fromkeys(BATCH_COLUMNS) | {"series": name, "error": message}]
+
+
+def _run_pool(tasks, workers):
+    # Rows per task from one process pool; None for the tasks a dead worker left unfinished
+    results = [None] * len(tasks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_fit_series, *task) for task in tasks]
+        for i, (task, future) in enumerate(zip(tasks, futures)):
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool:
+                # A dead worker breaks the whole pool: this and every other unfinished task fail with it
+                continue
+            except Exception as exc:
+                results[i] = _error_rows(task[0], f"worker failed: {exc}")
+    return results
+
+
+def _fit_series(name, values, index, orders, steps, alpha, timeout):
+    # Runs in a worker process: every failure is reported as a row, never raised
+    from statsmodels.tsa.arima.model import ARIMA
+
+    # A hard per-series timeout needs SIGALRM, i.e. a POSIX main thread; elsewhere
+    # the budget is only checked between orders
+    use_alarm = (timeout and hasattr(signal, "setitimer")
+                 and threading.current_thread() is threading.main_thread())
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    started = time.perf_counter()
+    try:
+        series = pd.Series(values, index=index)
+        best, best_order, errors = None, None, []
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for order in orders:
+                if timeout and time.perf_counter() - started > timeout:
+                    raise SeriesTimeout()
+                try:
+                    results = ARIMA(series, order=tuple(order)).fit()
+                except SeriesTimeout:
+                    raise
+                except Exception as exc:
+                    errors.append(f"{tuple(order)}: {exc}")
+                    continue
+                if best is None or results.aic < best.aic:
+                    best, best_order = results, tuple(order)
+            if best is None:
+                return _error_rows(name, "; ".join(errors) or "no order could be fitted")
+            frame = forecast_frame(best, steps=steps, alpha=alpha)
+        return [{
+            "series": name, "order": str(best_order), "aic": float(best.aic), "step": step,
+            "date": date, "mean": row["mean"], "lower": row["lower"], "upper": row["upper"], "error": None,
+        } for step, (date, row) in enumerate(frame.iterrows(), start=1)]
+    except SeriesTimeout:
+        return _error_rows(name, f"timed out after {timeout:g}s")
+    except Exception as exc:
+        return _error_rows(name, str(exc))
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+def forecast_many(series, orders=(DEFAULT_ORDER,), steps=1, alpha=0.05, workers=None,
+                  timeout=DEFAULT_SERIES_TIMEOUT):
+    """Forecast many series at once, one process-pool task per series.
+
+    ``series`` is a DataFrame (one column per series) or a mapping of name
+    to Series. For every series each order in ``orders`` is fitted and the
+    one with the lowest AIC is used. Returns a tidy DataFrame with one row
+    per series and forecast step (``series``, ``order``, ``aic``, ``step``,
+    ``date``, ``mean``, ``lower``, ``upper``). A series that fails, runs
+    past ``timeout`` seconds or kills its worker process gets a single row
+    with ``error`` set instead, and the other series are unaffected.
+    ``workers=1`` runs in-process.
+    """
+    items = series.items() if isinstance(series, (pd.DataFrame, dict)) else enumerate(series)
+    tasks = []
+    for name, values in items:
+        values = pd.Series(values).dropna()
+        tasks.append((name, values.to_numpy(dtype=float), values.index, list(orders), steps, alpha, timeout))
+
+    if workers == 1:
+        results = [_fit_series(*task) for task in tasks]
+    else:
+        # When a worker dies the series its pool had not finished are retried in a fresh pool;
+        # if that pool breaks too, each remaining series gets a pool of its own, so only a
+        # series that kills its worker ends up with an error
+        results = [None] * len(tasks)
+        pending = list(range(len(tasks)))
+        for attempt in range(2):
+            if not pending:
+                break
+            for i, rows in zip(pending, _run_pool([tasks[i] for i in pending], workers)):
+                results[i] = rows
+            pending = [i for i in pending if results[i] is None]
+        for i in pending:
+            results[i] = _run_pool([tasks[i]], 1)[0] or _error_rows(tasks[i][0], "worker process died")
+    return pd.DataFrame([row for rows in results for row in rows], columns=BATCH_COLUMNS)
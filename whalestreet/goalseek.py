@@ -0,0 +1,111 @@
+"""Goal seeking on the revenue models.
+
+Answers the two questions clients ask about the fee models, for one or
+many initial capitals at once:
+
+* what constant gross annual return is needed to net a target CAGR after
+  fees (:func:`required_return`),
+* at what gross return both models leave the same net capital
+  (:func:`breakeven_return`).
+
+Each question is a root of a function of the gross return that the
+vectorized fee engine evaluates for every capital in one call, and a
+bracketed solver (:func:`solve`) finds the roots for all capitals side by
+side. Net capital grows with the gross return in both models, so a bracket
+with a sign change holds exactly one root; capitals without a sign change
+get NaN.
+"""
+import numpy as np
+
+from whalestreet import fees
+
+DEFAULT_YEARS = 5
+DEFAULT_BRACKET = (-0.5, 2.0)  # gross annual returns searched, as fractions
+DEFAULT_TOLERANCE = 1e-8
+
+
+def solve(func, low, high, tolerance=DEFAULT_TOLERANCE, max_iterations=100):
+    """Vectorized bracketed root finding: roots of ``func`` between ``low`` and ``high``.
+
+    Uses the Illinois variant of regula falsi, which keeps the root
+    bracketed like bisection but converges superlinearly on the smooth,
+    monotone functions of the fee models. ``func`` maps an array of points
+    to an array of values of the same shape. ``low`` and ``high`` broadcast
+    to that shape; where ``func`` has the same sign at both ends the result
+    is NaN.
+    """
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    f_low, f_high = func(low), func(high)
+    bracketed = np.sign(f_low) != np.sign(f_high)
+    kept = np.zeros(low.shape, dtype=np.int8)  # end kept by the last step: -1 low, 1 high
+    point = low
+    for _ in range(max_iterations):
+        slope = f_high - f_low
+        secant = high - f_high * (high - low) / np.where(slope == 0, 1, slope)
+        new_point = np.where(slope == 0, (low + high) / 2, secant)
+        f_new = func(new_point)
+        # The root lies between the new point and the end of opposite sign
+        right = np.sign(f_new) == np.sign(f_low)
+        # Halve the value of an end kept twice in a row, so it cannot stall regula falsi
+        f_high = np.where(right & (kept == 1), f_high / 2, f_high)
+        f_low = np.where(~right & (kept == -1), f_low / 2, f_low)
+        low, f_low = np.where(right, new_point, low), np.where(right, f_new, f_low)
+        high, f_high = np.where(right, high, new_point), np.where(right, f_high, f_new)
+        kept = np.where(right, 1, -1).astype(np.int8)
+        converged = np.all((np.abs(new_point - point) <= tolerance) | (f_new == 0) | ~bracketed)
+        point = new_point
+        if converged:
+            break
+    return np.where(bracketed, point, np.nan)
+
+
+def _final_net_capital(model, initial_capital, annual_return, years, billing):
+    # Net capital after ``years`` of a constant return, one client per capital
+    returns = np.repeat(np.asarray(annual_return, dtype=float)[:, np.newaxis], years, axis=1)
+    if model == 'complex':
+        schedule = fees.complex_schedule(initial_capital, returns, billing)
+    elif model == 'simple':
+        schedule = fees.simple_model(initial_capital, returns)
+    else:
+        raise ValueError(f"unknown model {model!r}")
+    return schedule['net_capital'][:, -1]
+
+
+def net_cagr(model, initial_capital, annual_return, years=DEFAULT_YEARS, billing='annual'):
+    """Net annual growth rate after fees of a constant gross ``annual_return``."""
+    capital, annual_return = np.broadcast_arrays(np.atleast_1d(np.asarray(initial_capital, dtype=float)),
+                                                 np.atleast_1d(np.asarray(annual_return, dtype=float)))
+    net = _final_net_capital(model, capital, annual_return, years, billing)
+    return (net / capital) ** (1 / years) - 1
+
+
+def required_return(model, initial_capital, target_net_cagr, years=DEFAULT_YEARS, billing='annual',
+                    bracket=DEFAULT_BRACKET, tolerance=DEFAULT_TOLERANCE):
+    """Gross annual return needed for ``model`` to net ``target_net_cagr`` after fees.
+
+    ``initial_capital`` and ``target_net_cagr`` broadcast; returns an array
+    of their broadcast shape (at least 1-D), NaN where the target is out of
+    reach within ``bracket``.
+    """
+    capital, target = np.broadcast_arrays(np.atleast_1d(np.asarray(initial_capital, dtype=float)),
+                                          np.atleast_1d(np.asarray(target_net_cagr, dtype=float)))
+    return solve(lambda r: net_cagr(model, capital, r, years, billing) - target,
+                 np.full(capital.shape, bracket[0]), np.full(capital.shape, bracket[1]), tolerance)
+
+
+def breakeven_return(initial_capital, years=DEFAULT_YEARS, billing='annual',
+                     bracket=(0.0, DEFAULT_BRACKET[1]), tolerance=DEFAULT_TOLERANCE):
+    """Gross annual return at which Model 1 and Model 2 net the same capital.
+
+    Below it Model 2 (profit share only) leaves more capital; above it
+    Model 1's lower profit share outweighs its management fee. Returns an
+    array with one return per capital, NaN where the models do not cross
+    within ``bracket``.
+    """
+    capital = np.atleast_1d(np.asarray(initial_capital, dtype=float))
+
+    def difference(annual_return):
+        return (_final_net_capital('complex', capital, annual_return, years, billing)
+                - _final_net_capital('simple', capital, annual_return, years, billing))
+
+    return solve(difference, np.full(capital.shape, bracket[0]), np.full(capital.shape, bracket[1]), tolerance)
@@ -0,0 +1,156 @@
+"""Client ledger: capital, monthly P&L and holding periods in SQLite.
+
+The ledger keeps one row per client and one row per client and month of
+P&L. ``monthly_pnl`` is keyed on ``(client_id, month)``, so a client's
+history for a date range is an index range scan; a second index on
+``month`` serves date queries across clients. Pages read one page of
+clients at a time with :meth:`Ledger.clients` and only load the monthly
+P&L of the client on screen.
+
+Each operation opens its own short-lived connection, so a ``Ledger`` can
+be shared between sessions and threads. The database lives at
+``WHALESTREET_LEDGER_PATH`` (default ``.cache/ledger.sqlite3``) and is
+seeded with the sample clients the first time it is created.
+"""
+import os
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+
+LEDGER_PATH_ENV = "WHALESTREET_LEDGER_PATH"
+DEFAULT_LEDGER_PATH = os.path.join(".cache", "ledger.sqlite3")
+DEFAULT_PAGE_SIZE = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    client_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    initial_capital REAL NOT NULL,
+    total_capital REAL NOT NULL,
+    period TEXT NOT NULL,
+    verified_url TEXT
+);
+CREATE TABLE IF NOT EXISTS monthly_pnl (
+    client_id INTEGER NOT NULL REFERENCES clients (client_id),
+    month TEXT NOT NULL,  -- first day of the month, YYYY-MM-DD
+    profit REAL NOT NULL,
+    PRIMARY KEY (client_id, month)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS monthly_pnl_month ON monthly_pnl (month);
+"""
+
+# The clients shown on the dashboard before the ledger existed
+SAMPLE_CLIENTS = [
+    {"name": "Client 1", "initial_capital": 300000, "total_capital": 363000, "period": "5-6 months",
+     "verified_url": "https://console.zerodha.com/verified/8bda5085",
+     "profits": [10000, 12000, 15000, 18000, 20000, 22000]},
+    {"name": "Client 2", "initial_capital": 250000, "total_capital": 283750, "period": "2-3 months",
+     "verified_url": "https://console.zerodha.com/verified/27180ae7",
+     "profits": [8000, 10000, 15000, 21000, 34000, 45000]},
+    {"name": "Client 3", "initial_capital": 55000, "total_capital": 115000, "period": "1.8-2 years",
+     "verified_url": "https://console.zerodha.com/verified/ee5425f4",
+     "profits": [5000, 10000, 12000, 12000, 13500, 60000]},
+]
+SAMPLE_START_MONTH = "2024-01-01"
+
+
+def format_inr(amount):
+    """Whole rupees with Indian digit grouping, e.g. ``₹3,00,000``."""
+    sign = "-" if amount < 0 else ""
+    digits = str(int(round(abs(amount))))
+    head, tail = digits[:-3], digits[-3:]
+    groups = []
+    while len(head) > 2:
+        head, group = head[:-2], head[-2:]
+        groups.insert(0, group)
+    if head:
+        groups.insert(0, head)
+    return f"{sign}₹{','.join(groups + [tail])}"
+
+
+def _month(value):
+    return pd.Timestamp(value).to_period("M").start_time.strftime("%Y-%m-%d")
+
+
+class Ledger:
+    """Client capital and monthly P&L stored in a SQLite file."""
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        self.path = path
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    def initialize(self):
+        """Create the tables and indexes if they do not exist yet."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+        return self
+
+    def add_client(self, name, initial_capital, total_capital, period, verified_url=None):
+        """Insert a client and return its ``client_id``."""
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.execute(
+                "INSERT INTO clients (name, initial_capital, total_capital, period, verified_url)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (name, float(initial_capital), float(total_capital), period, verified_url))
+            return cursor.lastrowid
+
+    def record_pnl(self, client_id, months, profits):
+        """Insert or replace the P&L of ``client_id`` for the given months."""
+        rows = [(client_id, _month(month), float(profit)) for month, profit in zip(months, profits)]
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO monthly_pnl (client_id, month, profit) VALUES (?, ?, ?)", rows)
+
+    def client_count(self):
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+
+    def clients(self, offset=0, limit=DEFAULT_PAGE_SIZE):
+        """One page of clients in ``client_id`` order, with their total return in percent."""
+        query = """
+            SELECT client_id, name, initial_capital, total_capital, period, verified_url,
+                   (total_capital - initial_capital) / initial_capital * 100 AS total_return
+            FROM clients ORDER BY client_id LIMIT ? OFFSET ?
+        """
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(query, connection, params=(limit, offset), index_col="client_id")
+
+    def monthly_pnl(self, client_id, start=None, end=None):
+        """Monthly P&L of one client between ``start`` and ``end`` (inclusive months)."""
+        query = "SELECT month, profit FROM monthly_pnl WHERE client_id = ?"
+        params = [client_id]
+        if start is not None:
+            query += " AND month >= ?"
+            params.append(_month(start))
+        if end is not None:
+            query += " AND month <= ?"
+            params.append(_month(end))
+        with closing(self._connect()) as connection:
+            frame = pd.read_sql_query(query + " ORDER BY month", connection, params=params)
+        frame["month"] = pd.to_datetime(frame["month"])
+        return frame
+
+    def seed(self, clients=SAMPLE_CLIENTS, start_month=SAMPLE_START_MONTH):
+        """Add the sample clients and their P&L when the ledger is empty."""
+        if self.client_count():
+            return self
+        for client in clients:
+            profits = client["profits"]
+            client_id = self.add_client(client["name"], client["initial_capital"], client["total_capital"],
+                                        client["period"], client["verified_url"])
+            self.record_pnl(client_id, pd.date_range(start_month, periods=len(profits), freq="MS"), profits)
+        return self
+
+
+def ledger_from_env(environ=None):
+    """The ledger at ``WHALESTREET_LEDGER_PATH``, created and seeded if needed."""
+    environ = os.environ if environ is None else environ
+    return Ledger(environ.get(LEDGER_PATH_ENV, DEFAULT_LEDGER_PATH)).initialize().seed()
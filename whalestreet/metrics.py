@@ -0,0 +1,182 @@
+"""Vectorized risk and performance metrics.
+
+Every function takes periodic returns as a 1-D series or a 2-D
+``(periods, portfolios)`` matrix and works column-wise, so thousands of
+portfolios or Monte Carlo paths are scored in one call. 1-D input gives a
+scalar (or a 1-D series for :func:`drawdown`); pandas input keeps its index
+and column labels.
+"""
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+PERIODS_PER_YEAR = 12
+
+
+def _as_matrix(returns):
+    values = np.asarray(returns, dtype=float)
+    return values.reshape(len(values), -1)
+
+
+def _reduce_result(returns, values):
+    # Column-wise statistic: scalar for a single series, labelled for a DataFrame
+    if np.ndim(returns) == 1:
+        return float(values[0])
+    if isinstance(returns, pd.DataFrame):
+        return pd.Series(values, index=returns.columns)
+    return values
+
+
+def wealth_index(returns):
+    """Growth of one unit invested, period by period."""
+    return np.cumprod(1 + _as_matrix(returns), axis=0)
+
+
+def drawdown(returns):
+    """Running peak-to-trough drawdown (0 at a new high, negative below it).
+
+    The starting capital counts as the first peak, so a loss in the very
+    first period already shows as a drawdown.
+    """
+    wealth = wealth_index(returns)
+    peaks = np.maximum(np.maximum.accumulate(wealth, axis=0), 1.0)
+    values = wealth / peaks - 1
+    if isinstance(returns, pd.Series):
+        return pd.Series(values[:, 0], index=returns.index, name=returns.name)
+    if isinstance(returns, pd.DataFrame):
+        return pd.DataFrame(values, index=returns.index, columns=returns.columns)
+    return values[:, 0] if np.ndim(returns) == 1 else values
+
+
+def max_drawdown(returns):
+    """Deepest drawdown over the whole period (a negative fraction)."""
+    return _reduce_result(returns, np.min(_as_matrix(drawdown(returns)), axis=0))
+
+
+def sharpe_ratio(returns, risk_free=0.0, periods_per_year=PERIODS_PER_YEAR, ddof=1):
+    """Annualized Sharpe ratio; ``risk_free`` is a per-period rate."""
+    excess = _as_matrix(returns) - risk_free
+    values = excess.mean(axis=0) / excess.std(axis=0, ddof=ddof) * np.sqrt(periods_per_year)
+    return _reduce_result(returns, values)
+
+
+def downside_deviation(returns, target=0.0):
+    """Root mean square of the shortfalls below ``target``."""
+    shortfall = np.minimum(_as_matrix(returns) - target, 0.0)
+    return _reduce_result(returns, np.sqrt(np.mean(shortfall ** 2, axis=0)))
+
+
+def sortino_ratio(returns, target=0.0, periods_per_year=PERIODS_PER_YEAR):
+    """Annualized Sortino ratio against a per-period ``target`` return."""
+    excess = _as_matrix(returns) - target
+    downside = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2, axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = excess.mean(axis=0) / downside * np.sqrt(periods_per_year)
+    return _reduce_result(returns, values)
+
+
+def var_historical(returns, level=0.95):
+    """Historical Value-at-Risk: the loss not exceeded with probability ``level``."""
+    return _reduce_result(returns, -np.quantile(_as_matrix(returns), 1 - level, axis=0))
+
+
+def cvar_historical(returns, level=0.95):
+    """Historical Conditional VaR: the mean loss beyond the historical VaR."""
+    values = _as_matrix(returns)
+    cutoff = np.quantile(values, 1 - level, axis=0)
+    tail = values <= cutoff
+    return _reduce_result(returns, -(values * tail).sum(axis=0) / tail.sum(axis=0))
+
+
+def var_parametric(returns, level=0.95, ddof=1):
+    """Gaussian Value-at-Risk from the sample mean and volatility."""
+    values = _as_matrix(returns)
+    z = NormalDist().inv_cdf(1 - level)
+    return _reduce_result(returns, -(values.mean(axis=0) + z * values.std(axis=0, ddof=ddof)))
+
+
+def cvar_parametric(returns, level=0.95, ddof=1):
+    """Gaussian Conditional VaR (expected shortfall)."""
+    values = _as_matrix(returns)
+    z = NormalDist().inv_cdf(1 - level)
+    tail_factor = NormalDist().pdf(z) / (1 - level)
+    return _reduce_result(returns, -(values.mean(axis=0) - tail_factor * values.std(axis=0, ddof=ddof)))
+
+
+def summarize(returns, level=0.95, risk_free=0.0, periods_per_year=PERIODS_PER_YEAR, ddof=1):
+    """All metrics for every column in one pass over the data.
+
+    The shared moments, drawdowns and tail quantiles are computed once.
+    Returns a DataFrame with one row per portfolio (column of ``returns``).
+    """
+    values = _as_matrix(returns)
+    mean = values.mean(axis=0)
+    std = values.std(axis=0, ddof=ddof)
+    excess_mean = mean - risk_free
+    downside = np.sqrt(np.mean(np.minimum(values - risk_free, 0.0) ** 2, axis=0))
+
+    wealth = np.cumprod(1 + values, axis=0)
+    peaks = np.maximum(np.maximum.accumulate(wealth, axis=0), 1.0)
+
+    cutoff = np.quantile(values, 1 - level, axis=0)
+    tail = values <= cutoff
+    normal = NormalDist()
+    z = normal.inv_cdf(1 - level)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame = pd.DataFrame({
+            "annualized_return": (wealth[-1] ** (periods_per_year / len(values)) - 1),
+            "annualized_volatility": std * np.sqrt(periods_per_year),
+            "sharpe_ratio": excess_mean / std * np.sqrt(periods_per_year),
+            "sortino_ratio": excess_mean / downside * np.sqrt(periods_per_year),
+            "max_drawdown": np.min(wealth / peaks - 1, axis=0),
+            "var_historical": -cutoff,
+            "cvar_historical": -(values * tail).sum(axis=0) / tail.sum(axis=0),
+            "var_parametric": -(mean + z * std),
+            "cvar_parametric": -(mean - normal.pdf(z) / (1 - level) * std),
+        })
+    if isinstance(returns, pd.DataFrame):
+        frame.index = returns.columns
+    return frame
+
+
+def benchmark_statistics(returns, benchmark, windows=None, periods_per_year=PERIODS_PER_YEAR, ddof=1):
+    """Beta, correlation and annualized tracking error of every column against ``benchmark``.
+
+    ``windows`` are trailing window lengths in periods (``None`` means the
+    whole history); windows longer than the history keep their label and
+    get NaN statistics. All windows and columns
+    come out of one product of a ``(windows, periods)`` window mask with
+    the stacked returns, cross products and squares. Returns a DataFrame
+    indexed by ``(window, column)``.
+    """
+    values = _as_matrix(returns)
+    bench = np.asarray(benchmark, dtype=float).reshape(-1, 1)
+    periods, columns = values.shape
+    windows = [periods] if windows is None else [int(window) for window in np.atleast_1d(windows)]
+
+    # Moments are shift invariant; centering on the full-history means keeps the sums well conditioned
+    values = values - values.mean(axis=0)
+    bench = bench - bench.mean()
+    mask = np.arange(periods) >= periods - np.asarray(windows)[:, np.newaxis]
+    sums = mask @ np.hstack([values, values ** 2, values * bench, bench, bench ** 2])
+    count = mask.sum(axis=1)[:, np.newaxis]
+    x, xx, xb = sums[:, :columns], sums[:, columns:2 * columns], sums[:, 2 * columns:3 * columns]
+    b, bb = sums[:, -2:-1], sums[:, -1:]
+
+    var_x = (xx - x * x / count) / (count - ddof)
+    var_b = (bb - b * b / count) / (count - ddof)
+    cov = (xb - x * b / count) / (count - ddof)
+    # Windows the history cannot fill
+    short = np.asarray(windows)[:, np.newaxis] > periods
+    var_x, var_b, cov = (np.where(short, np.nan, value) for value in (var_x, var_b, cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame = pd.DataFrame({
+            "beta": (cov / var_b).ravel(),
+            "correlation": (cov / np.sqrt(var_x * var_b)).ravel(),
+            "tracking_error": np.sqrt(np.maximum(var_x + var_b - 2 * cov, 0.0) * periods_per_year).ravel(),
+        })
+    labels = returns.columns if isinstance(returns, pd.DataFrame) else range(columns)
+    frame.index = pd.MultiIndex.from_product([windows, labels], names=["window", "column"])
+    return frame
@@ -0,0 +1,282 @@
+"""Chunked Monte Carlo engine for portfolio growth projections.
+
+Paths are generated in blocks of at most ``chunk_size`` rows and each block
+is folded into a fixed-size per-step histogram of log growth, so memory
+stays bounded no matter how many paths are simulated. Only a handful of
+percentile lines (plus the exact mean) leave the engine, which keeps the
+chart payload independent of the path count.
+
+Every block draws from its own ``numpy.random.Generator`` spawned from a
+single ``SeedSequence``, so blocks can be spread over a thread or process
+pool and the result is bit-for-bit the same for any number of workers.
+
+Returns are either i.i.d. normal or resampled from a historical series
+with the stationary bootstrap (Politis and Romano): each path strings
+together blocks of consecutive historical returns with geometrically
+distributed lengths, which keeps the fat tails and the short-range
+autocorrelation of the history. The resampling indices of a whole block of
+paths are generated with array operations, without a loop over paths.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_MAX_MEMORY_MB = 64
+DEFAULT_BINS = 4096
+DEFAULT_MEAN_BLOCK_LENGTH = 6  # periods
+RETURN_FLOOR = -0.99  # normal draws are floored here so wealth stays positive
+
+# Peak (rows, horizon) arrays per block, measured with tracemalloc: the growth paths, the
+# bin positions and the bin indices while binning; bootstrapping peaks slightly higher
+# while it builds the resampling indices (block starts, draws and a boolean mask)
+NORMAL_BLOCK_ARRAYS = 3
+BOOTSTRAP_BLOCK_ARRAYS = 3.25
+
+# Histogram range per step, in standard deviations of log growth around its mean
+_RANGE_STDS = 8.0
+_MIN_LOG_GROWTH = np.log(1e-12)
+
+
+def chunk_rows(horizon, max_memory_mb=DEFAULT_MAX_MEMORY_MB, arrays=NORMAL_BLOCK_ARRAYS, bins=DEFAULT_BINS):
+    """Number of paths per block so a block's working arrays fit the budget.
+
+    ``arrays`` is the peak number of ``(rows, horizon)`` 8-byte arrays
+    alive while a block is generated and binned. The histogram and the
+    bin counts of a block do not grow with the rows; they and a 1 MiB
+    allowance for everything else come off the budget first.
+    """
+    fixed_bytes = 2 * horizon * bins * 8 + 2 ** 20
+    bytes_per_path = horizon * 8 * arrays
+    return max(1, int((max_memory_mb * 2 ** 20 - fixed_bytes) // bytes_per_path))
+
+
+def plan_blocks(n_paths, chunk_size, seed):
+    """Split ``n_paths`` into blocks, each paired with its own spawned seed.
+
+    The plan depends only on the path count, block size and seed, never on
+    the number of workers, which is what makes parallel runs reproducible.
+    """
+    rows = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        rows.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(rows))
+    return list(zip(seeds, rows))
+
+
+def stationary_bootstrap_indices(rng, rows, horizon, n_history, mean_block_length=DEFAULT_MEAN_BLOCK_LENGTH):
+    """``(rows, horizon)`` indices into a history of ``n_history`` periods.
+
+    Each step starts a new block at a uniformly drawn period with
+    probability ``1 / mean_block_length`` (the first step always does) and
+    otherwise takes the period after the previous one, wrapping around at
+    the end of the history. A mean block length of 1 is the i.i.d.
+    bootstrap.
+    """
+    steps = np.arange(horizon)
+    new_block = rng.random((rows, horizon)) < 1 / mean_block_length
+    new_block[:, 0] = True
+    # Step at which the current block started, carried forward along each path
+    block_start = np.where(new_block, steps, 0)
+    del new_block
+    np.maximum.accumulate(block_start, axis=1, out=block_start)
+    index = np.take_along_axis(rng.integers(n_history, size=(rows, horizon)), block_start, axis=1)
+    index += steps
+    index -= block_start
+    index %= n_history
+    return index
+
+
+def iter_path_blocks(blocks, horizon, drift, volatility, history=None,
+                     mean_block_length=DEFAULT_MEAN_BLOCK_LENGTH):
+    """Yield ``(rows, horizon)`` blocks of cumulative growth factors.
+
+    Returns are normal with ``drift`` and ``volatility`` (floored at
+    ``RETURN_FLOOR``, like :func:`simulate_return_paths`), or bootstrapped
+    from the periodic returns in ``history`` when it is given.
+    """
+    for seed, rows in blocks:
+        rng = np.random.default_rng(seed)
+        if history is None:
+            returns = rng.normal(loc=drift, scale=volatility, size=(rows, horizon))
+            np.maximum(returns, RETURN_FLOOR, out=returns)
+        else:
+            returns = history[stationary_bootstrap_indices(rng, rows, horizon, len(history), mean_block_length)]
+        # Growth factors overwrite the returns, so a block keeps a single path array
+        returns += 1
+        yield np.cumprod(returns, axis=1, out=returns)
+        # Drop this block before the next one is generated, or two blocks would be alive at once
+        del returns
+
+
+def simulate_return_paths(n_paths, horizon, drift, volatility, seed=42):
+    """``(n_paths, horizon)`` i.i.d. normal returns, floored at ``RETURN_FLOOR``.
+
+    Small enough batches (e.g. a few years of annual returns) are kept in
+    memory whole, for engines that need every path, such as the fee models.
+    """
+    rng = np.random.default_rng(seed)
+    return np.maximum(rng.normal(loc=drift, scale=volatility, size=(n_paths, horizon)), RETURN_FLOOR)
+
+
+class PercentileAccumulator:
+    """Streaming per-step distribution of growth paths.
+
+    Keeps a histogram of log growth with ``bins`` buckets per step over a
+    fixed range, the exact running sum for the mean and the exact min/max.
+    Percentiles are read off the histogram with linear interpolation inside
+    a bucket, so their error is bounded by the bucket width.
+    """
+
+    def __init__(self, low, high, bins=DEFAULT_BINS):
+        self.low = np.asarray(low, dtype=float)
+        self.width = np.asarray(high, dtype=float) - self.low
+        self.bins = bins
+        self.horizon = len(self.low)
+        self.counts = np.zeros((self.horizon, bins), dtype=np.int64)
+        # Per-block sums are kept in block order so the mean does not depend
+        # on how blocks were grouped across workers
+        self.block_totals = []
+        self.minimum = np.full(self.horizon, np.inf)
+        self.maximum = np.full(self.horizon, -np.inf)
+        self.n_paths = 0
+
+    @classmethod
+    def for_normal_returns(cls, horizon, drift, volatility, bins=DEFAULT_BINS):
+        """Accumulator whose range covers i.i.d. normal monthly returns."""
+        steps = np.arange(1, horizon + 1)
+        center = steps * (np.log1p(drift) - volatility ** 2 / 2)
+        spread = np.maximum(_RANGE_STDS * volatility * np.sqrt(steps), 1e-6)
+        return cls(center - spread, center + spread, bins)
+
+    def add(self, growth):
+        """Fold a ``(rows, horizon)`` block of growth factors into the histogram."""
+        # Log growth is scaled to bin positions in place, in one scratch array
+        position = np.maximum(growth, np.exp(_MIN_LOG_GROWTH))
+        np.log(position, out=position)
+        position -= self.low
+        position /= self.width
+        position *= self.bins
+        index = position.astype(np.int64)
+        del position
+        np.clip(index, 0, self.bins - 1, out=index)
+        index += np.arange(self.horizon) * self.bins
+        self.counts += np.bincount(index.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.block_totals.append(growth.sum(axis=0))
+        self.minimum = np.minimum(self.minimum, growth.min(axis=0))
+        self.maximum = np.maximum(self.maximum, growth.max(axis=0))
+        self.n_paths += len(growth)
+
+    def merge(self, other):
+        """Combine with an accumulator built over the same range."""
+        self.counts += other.counts
+        self.block_totals.extend(other.block_totals)
+        self.minimum = np.minimum(self.minimum, other.minimum)
+        self.maximum = np.maximum(self.maximum, other.maximum)
+        self.n_paths += other.n_paths
+        return self
+
+    def mean(self):
+        return np.add.reduce(np.array(self.block_totals), axis=0) / self.n_paths
+
+    def percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """Growth factor at each requested percentile, shape ``(len(percentiles), horizon)``."""
+        cumulative = np.cumsum(self.counts, axis=1)
+        edges_step = self.width / self.bins
+        result = np.empty((len(percentiles), self.horizon))
+        for row, percentile in enumerate(percentiles):
+            target = percentile / 100 * self.n_paths
+            # First bucket whose cumulative count reaches the target rank
+            bucket = np.minimum((cumulative < target).sum(axis=1), self.bins - 1)
+            steps = np.arange(self.horizon)
+            below = np.where(bucket > 0, cumulative[steps, np.maximum(bucket - 1, 0)], 0)
+            inside = self.counts[steps, bucket]
+            fraction = np.where(inside > 0, (target - below) / np.maximum(inside, 1), 0.0)
+            log_value = self.low + (bucket + fraction) * edges_step
+            result[row] = np.exp(log_value)
+        return np.clip(result, self.minimum, self.maximum)
+
+
+def percentile_frame(accumulator, percentiles=DEFAULT_PERCENTILES):
+    """Percentile bands and mean as cumulative returns, one row per step."""
+    bands = accumulator.percentiles(percentiles) - 1
+    frame = pd.DataFrame(bands.T, columns=[f"p{p:g}" for p in percentiles],
+                         index=pd.RangeIndex(1, accumulator.horizon + 1, name="step"))
+    frame["mean"] = accumulator.mean() - 1
+    return frame
+
+
+def _accumulate_blocks(blocks, horizon, drift, volatility, low, high, bins, history=None,
+                       mean_block_length=DEFAULT_MEAN_BLOCK_LENGTH):
+    # Module-level so it can be shipped to a process pool
+    accumulator = PercentileAccumulator(low, high, bins)
+    for growth in iter_path_blocks(blocks, horizon, drift, volatility, history, mean_block_length):
+        accumulator.add(growth)
+        del growth
+    return accumulator
+
+
+def run_blocks(blocks, accumulator, workers=1, executor="thread", **block_args):
+    """Fold ``blocks`` into ``accumulator``, optionally on a worker pool.
+
+    ``workers=None`` uses every CPU core. Blocks are split into contiguous
+    groups, one per worker, and merged back in block order.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(blocks)) or 1
+    args = dict(low=accumulator.low, high=accumulator.low + accumulator.width,
+                bins=accumulator.bins, **block_args)
+    if workers == 1:
+        return accumulator.merge(_accumulate_blocks(blocks, **args))
+
+    groups = [list(group) for group in np.array_split(np.arange(len(blocks)), workers)]
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        futures = [pool.submit(_accumulate_blocks, [blocks[i] for i in group], **args) for group in groups]
+        for future in futures:
+            accumulator.merge(future.result())
+    return accumulator
+
+
+def simulate_percentile_bands(n_paths=100_000, horizon=12, drift=0.01, volatility=0.02, seed=42,
+                              percentiles=DEFAULT_PERCENTILES, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                              chunk_size=None, bins=DEFAULT_BINS, workers=1, executor="thread"):
+    """Simulate i.i.d. normal monthly returns and reduce them to percentile bands.
+
+    Returns a DataFrame indexed by step (1..horizon) with one column per
+    percentile (``p5``, ``p50``...) and a ``mean`` column, all expressed as
+    cumulative returns. ``workers`` and ``executor`` (``"thread"`` or
+    ``"process"``) only change the wall time, never the result; the memory
+    budget applies to each worker.
+    """
+    chunk_size = chunk_size or chunk_rows(horizon, max_memory_mb, bins=bins)
+    blocks = plan_blocks(n_paths, chunk_size, seed)
+    accumulator = PercentileAccumulator.for_normal_returns(horizon, drift, volatility, bins)
+    run_blocks(blocks, accumulator, workers=workers, executor=executor,
+               horizon=horizon, drift=drift, volatility=volatility)
+    return percentile_frame(accumulator, percentiles)
+
+
+def simulate_bootstrap_bands(history, n_paths=100_000, horizon=12, mean_block_length=DEFAULT_MEAN_BLOCK_LENGTH,
+                             seed=42, percentiles=DEFAULT_PERCENTILES, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                             chunk_size=None, bins=DEFAULT_BINS, workers=1, executor="thread"):
+    """Stationary-bootstrap counterpart of :func:`simulate_percentile_bands`.
+
+    ``history`` holds the historical periodic returns the paths are
+    resampled from, and ``mean_block_length`` the mean length, in periods,
+    of the stretches of consecutive history each path reuses. The result
+    has the same layout as :func:`simulate_percentile_bands`.
+    """
+    history = np.asarray(history, dtype=float)
+    history = history[~np.isnan(history)]
+    if not len(history):
+        raise ValueError("history has no returns to resample")
+    chunk_size = chunk_size or chunk_rows(horizon, max_memory_mb, BOOTSTRAP_BLOCK_ARRAYS, bins)
+    blocks = plan_blocks(n_paths, chunk_size, seed)
+    # Histogram range sized like normal returns with the history's moments; the
+    # exact min/max still clip the outer percentiles if a tail falls outside it
+    accumulator = PercentileAccumulator.for_normal_returns(horizon, history.mean(), history.std(), bins)
+    run_blocks(blocks, accumulator, workers=workers, executor=executor, horizon=horizon, drift=None,
+               volatility=None, history=history, mean_block_length=mean_block_length)
+    return percentile_frame(accumulator, percentiles)
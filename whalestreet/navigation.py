@@ -0,0 +1,16 @@
+"""Dashboard pages in sidebar order, as (script path relative to the app, title)."""
+
+PAGES = [
+    ("app_pages/overview.py", "Overview"),
+    ("app_pages/key_features.py", "Key Features"),
+    ("app_pages/portfolio_performance.py", "Portfolio Performance"),
+    ("app_pages/client_pnl.py", "Client P&L"),
+    ("app_pages/investment_strategy.py", "Investment Strategy"),
+    ("app_pages/growth_projections.py", "Growth Projections"),
+    ("app_pages/understand_the_risk.py", "Understand the Risk"),
+    ("app_pages/why_whalestreet.py", "Why Whalestreet PMS Stands Out"),
+    ("app_pages/sharing_revenue_model.py", "Sharing Revenue Model"),
+    ("app_pages/steps_to_start.py", "Steps to Start Your PMS"),
+    ("app_pages/promising_aspects.py", "Promising Aspects of Whalesstreet"),
+    ("app_pages/resources_contact.py", "Resources & Contact"),
+]
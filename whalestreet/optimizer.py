@@ -0,0 +1,104 @@
+"""Long-only mean-variance frontier and Black-Litterman expected returns.
+
+The frontier is traced by maximizing ``mu @ w - risk_aversion / 2 * w @ cov @ w``
+over fully invested, long-only weights for many risk aversions at once.
+The constraints rule out a closed form, so every risk level is solved by
+accelerated projected gradient ascent (FISTA) with a projection onto the
+simplex; all levels advance together as rows of one ``(levels, assets)``
+array, so the whole frontier costs one loop of small matrix products.
+
+Black-Litterman starts from the returns implied by market weights and
+blends in views on (relative) asset returns, weighted by how confident each
+view is. Both take annualized inputs and give annualized outputs.
+"""
+import numpy as np
+
+DEFAULT_RISK_AVERSION = 2.5  # market risk aversion implied by equity premia
+DEFAULT_TAU = 0.05  # uncertainty of the equilibrium returns relative to the covariance
+DEFAULT_TOLERANCE = 1e-10
+
+
+def project_to_simplex(weights):
+    """Euclidean projection of each row onto ``{w >= 0, sum(w) == 1}``."""
+    weights = np.asarray(weights, dtype=float)
+    n = weights.shape[-1]
+    ordered = -np.sort(-weights, axis=-1)
+    excess = np.cumsum(ordered, axis=-1) - 1
+    positive = ordered - excess / np.arange(1, n + 1) > 0
+    # Number of coordinates that stay positive, i.e. the last index where the test holds
+    count = n - np.argmax(positive[..., ::-1], axis=-1)
+    shift = np.take_along_axis(excess, count[..., np.newaxis] - 1, axis=-1) / count[..., np.newaxis]
+    return np.maximum(weights - shift, 0.0)
+
+
+def efficient_frontier(expected_returns, covariance, risk_aversions, max_iterations=10_000,
+                       tolerance=DEFAULT_TOLERANCE):
+    """Long-only mean-variance optimal portfolios for every risk aversion.
+
+    Returns ``(weights, returns, volatilities)`` with ``weights`` of shape
+    ``(levels, assets)``, one row per entry of ``risk_aversions`` (which
+    must be positive).
+    """
+    mu = np.asarray(expected_returns, dtype=float)
+    cov = np.asarray(covariance, dtype=float)
+    gamma = np.asarray(risk_aversions, dtype=float)[:, np.newaxis]
+    # Step size 1 / Lipschitz constant of the gradient, per risk level
+    step = 1 / (gamma * np.linalg.eigvalsh(cov)[-1])
+
+    weights = np.full((len(gamma), len(mu)), 1 / len(mu))
+    momentum, t = weights, 1.0
+    for _ in range(max_iterations):
+        gradient = mu - gamma * (momentum @ cov)
+        updated = project_to_simplex(momentum + step * gradient)
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        momentum = updated + (t - 1) / t_next * (updated - weights)
+        converged = np.max(np.abs(updated - weights)) <= tolerance
+        weights, t = updated, t_next
+        if converged:
+            break
+
+    returns = weights @ mu
+    volatilities = np.sqrt(np.einsum("ij,jk,ik->i", weights, cov, weights))
+    return weights, returns, volatilities
+
+
+def implied_returns(covariance, market_weights, risk_aversion=DEFAULT_RISK_AVERSION):
+    """Equilibrium returns under which ``market_weights`` are mean-variance optimal."""
+    return risk_aversion * np.asarray(covariance, dtype=float) @ np.asarray(market_weights, dtype=float)
+
+
+def view_uncertainty(covariance, views, confidences, tau=DEFAULT_TAU):
+    """Diagonal view covariance ``Omega`` from a confidence in ``(0, 1]`` per view.
+
+    A view's variance is its variance under the prior, scaled by
+    ``(1 - confidence) / confidence``: 50% confidence weighs the view like
+    the prior, 100% makes it exact.
+    """
+    views = np.atleast_2d(np.asarray(views, dtype=float))
+    confidences = np.clip(np.asarray(confidences, dtype=float), 1e-6, 1.0)
+    prior_variance = np.einsum("ij,jk,ik->i", views, tau * np.asarray(covariance, dtype=float), views)
+    return np.diag(prior_variance * (1 - confidences) / confidences)
+
+
+def black_litterman(covariance, market_weights, views, view_returns, confidences=0.5,
+                    tau=DEFAULT_TAU, risk_aversion=DEFAULT_RISK_AVERSION):
+    """Posterior expected returns and covariance.
+
+    ``views`` is a ``(views, assets)`` matrix whose rows pick the assets
+    (or long/short combinations) each view is about, and ``view_returns``
+    the annual return expected of each row. Returns ``(expected_returns,
+    covariance)`` of the posterior.
+    """
+    cov = np.asarray(covariance, dtype=float)
+    views = np.atleast_2d(np.asarray(views, dtype=float))
+    view_returns = np.atleast_1d(np.asarray(view_returns, dtype=float))
+    prior = implied_returns(cov, market_weights, risk_aversion)
+    omega = view_uncertainty(cov, views, np.broadcast_to(confidences, view_returns.shape), tau)
+
+    # Posterior in the form that stays defined for exact views (Omega = 0)
+    tau_cov = tau * cov
+    exposure = tau_cov @ views.T
+    system = views @ exposure + omega
+    expected = prior + exposure @ np.linalg.solve(system, view_returns - views @ prior)
+    posterior_cov = cov + tau_cov - exposure @ np.linalg.solve(system, exposure.T)
+    return expected, posterior_cov
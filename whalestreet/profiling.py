@@ -0,0 +1,71 @@
+"""Opt-in section timing for dashboard reruns.
+
+The dashboard wraps its hot paths (simulations, ARIMA fits, fee models,
+figure construction and ``st.plotly_chart`` serialization) in
+``SectionTimer.section`` blocks. When profiling is off, a section is a
+shared no-op context manager, so the instrumentation costs next to nothing
+in production; when it is on, every section's wall time is recorded and
+summarized per section name for a structured log line and an on-page
+table.
+"""
+import contextlib
+import os
+import time
+
+import pandas as pd
+
+ENV_VAR = "WHALESTREET_PROFILE"
+QUERY_PARAM = "profile"
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_DISABLED = contextlib.nullcontext()
+
+
+def is_enabled(query_value=None, environ=None):
+    """Whether profiling is requested by ``?profile=1`` or ``WHALESTREET_PROFILE=1``."""
+    environ = os.environ if environ is None else environ
+    values = (query_value, environ.get(ENV_VAR))
+    return any(str(value).strip().lower() in _TRUTHY for value in values if value is not None)
+
+
+class SectionTimer:
+    """Records the wall time of named sections of one script run."""
+
+    def __init__(self, enabled=True, started=None, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.started = clock() if started is None else started
+        self.timings = []  # (section, seconds) in completion order
+
+    def section(self, name):
+        """Context manager timing the enclosed block under ``name``."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.timings.append((name, self.clock() - started))
+
+    def summary(self):
+        """Per-section calls, total seconds and share of the run so far, slowest first."""
+        total = self.clock() - self.started
+        frame = pd.DataFrame(self.timings, columns=["section", "seconds"])
+        frame = frame.groupby("section", sort=False)["seconds"].agg(calls="count", seconds="sum").reset_index()
+        frame["share"] = frame["seconds"] / total if total > 0 else 0.0
+        return frame.sort_values("seconds", ascending=False, ignore_index=True)
+
+    def record(self, **fields):
+        """JSON-serializable summary of the run, for structured logging."""
+        return {
+            **fields,
+            "total_s": round(self.clock() - self.started, 6),
+            "sections": [
+                {"section": row.section, "calls": int(row.calls), "seconds": round(float(row.seconds), 6)}
+                for row in self.summary().itertuples()
+            ],
+        }
@@ -0,0 +1,108 @@
+"""Server-side decimation and WebGL switching for long line charts.
+
+A browser draws a few thousand points per trace at most usefully; beyond
+that the payload and SVG rendering cost grow while the picture does not
+change. :func:`line_trace` downsamples a series to ``max_points`` and uses
+``Scattergl`` when the trace is still large:
+
+* ``"lttb"`` (Largest-Triangle-Three-Buckets) keeps the visual shape of a
+  line,
+* ``"minmax"`` keeps the lowest and highest point of every bucket, so
+  drawdown troughs and peaks are exact.
+
+Both methods always keep the first, last, global minimum and global maximum
+points. plotly is imported on use so this module stays cheap to import.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 1500
+WEBGL_THRESHOLD = 1000
+
+
+def _numeric_x(x):
+    values = np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    if values.dtype == object:
+        return np.arange(len(values), dtype=float)
+    return values.astype(float)
+
+
+def lttb_indices(x, y, max_points):
+    """Indices picked by Largest-Triangle-Three-Buckets."""
+    x = _numeric_x(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    # First and last points are kept; the rest is split into max_points - 2 buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        # Point of this bucket forming the largest triangle with the previous pick and next bucket's mean
+        area = np.abs((x[selected] - next_x) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (next_y - y[selected]))
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def minmax_indices(y, max_points):
+    """Indices of the minimum and maximum of each of ``max_points // 2`` buckets."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    buckets = max(max_points // 2, 1)
+    if max_points >= n:
+        return np.arange(n)
+    bucket = np.arange(n) * buckets // n
+    # Sorted by bucket then value: each bucket's first and last entries are its min and max
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket[order], np.arange(buckets))
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
+
+
+def decimate(x, y, max_points=DEFAULT_MAX_POINTS, method="lttb"):
+    """Downsample ``(x, y)`` to about ``max_points`` points.
+
+    Returns the selected ``x`` and ``y`` (pandas input keeps its type).
+    The global minimum and maximum are always kept.
+    """
+    values = np.asarray(y, dtype=float)
+    if len(values) <= max_points:
+        return x, y
+    if method == "lttb":
+        indices = lttb_indices(x, values, max_points)
+    elif method == "minmax":
+        indices = minmax_indices(values, max_points)
+    else:
+        raise ValueError(f"unknown decimation method {method!r}")
+    indices = np.unique(np.r_[indices, np.nanargmin(values), np.nanargmax(values)])
+    return _take(x, indices), _take(y, indices)
+
+
+def _take(values, indices):
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values[indices] if isinstance(values, pd.Index) else values.iloc[indices]
+    return np.asarray(values)[indices]
+
+
+def line_trace(x, y, max_points=DEFAULT_MAX_POINTS, webgl_threshold=WEBGL_THRESHOLD, method="lttb", **trace):
+    """A ``Scatter`` trace, decimated and switched to WebGL when large.
+
+    ``trace`` holds the usual ``go.Scatter`` arguments (mode, name, line,
+    fill, hovertemplate...); per-point arrays other than ``x``/``y`` are not
+    supported.
+    """
+    import plotly.graph_objects as go
+
+    x, y = decimate(x, y, max_points=max_points, method=method)
+    trace_class = go.Scattergl if len(y) > webgl_threshold else go.Scatter
+    return trace_class(x=x, y=y, **trace)
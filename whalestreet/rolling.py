@@ -0,0 +1,148 @@
+"""Incremental rolling-window metrics.
+
+``RollingMetrics`` consumes one return at a time and updates every metric
+in O(1) amortized time, so a long daily history is processed in a single
+pass instead of recomputing each window from scratch:
+
+* mean and volatility with Welford-style add/remove updates,
+* downside deviation (for Sortino) with a running sum of squared shortfalls,
+* drawdown from the rolling peak with a monotonic deque,
+* max drawdown inside the window with a two-stack queue over the
+  associative (peak, trough, max drop) summary of log wealth.
+"""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from whalestreet.metrics import PERIODS_PER_YEAR
+
+COLUMNS = ["volatility", "sharpe_ratio", "sortino_ratio", "drawdown", "max_drawdown"]
+
+
+def _combine(older, newer):
+    # Summary of log wealth over a stretch: (highest, lowest, largest peak-to-later-trough drop)
+    return (max(older[0], newer[0]), min(older[1], newer[1]),
+            max(older[2], newer[2], older[0] - newer[1]))
+
+
+class _DrawdownQueue:
+    """Sliding-window max drawdown via a two-stack queue of log wealth points."""
+
+    def __init__(self):
+        self._front = []  # (value, summary of this value and everything newer in front)
+        self._back = []  # (value, summary of the back stack up to this value)
+
+    def push(self, value):
+        point = (value, value, 0.0)
+        summary = _combine(self._back[-1][1], point) if self._back else point
+        self._back.append((value, summary))
+
+    def pop(self):
+        if not self._front:
+            # Move the back stack over, building suffix summaries from the newest down
+            summary = None
+            while self._back:
+                value, _ = self._back.pop()
+                point = (value, value, 0.0)
+                summary = point if summary is None else _combine(point, summary)
+                self._front.append((value, summary))
+        self._front.pop()
+
+    def max_drop(self):
+        if self._front and self._back:
+            return _combine(self._front[-1][1], self._back[-1][1])[2]
+        return (self._front or self._back)[-1][1][2]
+
+
+class RollingMetrics:
+    """Streaming rolling metrics over the last ``window`` periodic returns.
+
+    Feed returns with :meth:`update`; it returns the metrics of the current
+    window (``None`` values until the window is full). Ratios are annualized
+    with ``periods_per_year``; ``target`` is the per-period Sortino target.
+    """
+
+    def __init__(self, window, periods_per_year=PERIODS_PER_YEAR, target=0.0):
+        if window < 2:
+            raise ValueError("window must be at least 2 periods")
+        self.window = window
+        self.periods_per_year = periods_per_year
+        self.target = target
+        self._returns = deque()
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+        # Wealth points: the window of n returns spans n + 1 wealth values
+        self._log_wealth = 0.0
+        self._step = 0
+        self._peaks = deque([(0, 0.0)])  # (step, log wealth), decreasing
+        self._drops = _DrawdownQueue()
+        self._drops.push(0.0)
+
+    def _add(self, value):
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._downside_sq += min(value - self.target, 0.0) ** 2
+
+    def _remove(self, value):
+        previous_mean = self._mean
+        self._count -= 1
+        self._mean = (previous_mean * (self._count + 1) - value) / self._count
+        self._m2 -= (value - previous_mean) * (value - self._mean)
+        self._downside_sq -= min(value - self.target, 0.0) ** 2
+
+    def update(self, value):
+        """Add the next return and return the metrics of the current window."""
+        value = float(value)
+        self._returns.append(value)
+        self._add(value)
+        self._step += 1
+        self._log_wealth += np.log1p(value)
+
+        while self._peaks and self._peaks[-1][1] <= self._log_wealth:
+            self._peaks.pop()
+        self._peaks.append((self._step, self._log_wealth))
+        self._drops.push(self._log_wealth)
+
+        if len(self._returns) > self.window:
+            self._remove(self._returns.popleft())
+            self._drops.pop()
+        # The oldest wealth point still in the window is at step - window
+        while self._peaks[0][0] < self._step - self.window:
+            self._peaks.popleft()
+
+        if len(self._returns) < self.window:
+            return dict.fromkeys(COLUMNS)
+        return self.current()
+
+    def current(self):
+        """Metrics of the current window."""
+        variance = max(self._m2, 0.0) / (self._count - 1)
+        volatility = np.sqrt(variance)
+        downside = np.sqrt(max(self._downside_sq, 0.0) / self._count)
+        scale = np.sqrt(self.periods_per_year)
+        return {
+            "volatility": volatility * scale,
+            "sharpe_ratio": self._mean / volatility * scale if volatility > 0 else np.nan,
+            "sortino_ratio": (self._mean - self.target) / downside * scale if downside > 0 else np.nan,
+            "drawdown": np.expm1(self._log_wealth - self._peaks[0][1]),
+            "max_drawdown": np.expm1(-self._drops.max_drop()),
+        }
+
+
+def rolling_metrics(returns, window, periods_per_year=PERIODS_PER_YEAR, target=0.0):
+    """Rolling metrics for a whole return series in one incremental pass.
+
+    Returns a DataFrame indexed like ``returns`` with annualized
+    ``volatility``, ``sharpe_ratio`` and ``sortino_ratio``, the current
+    ``drawdown`` from the rolling peak and the window's ``max_drawdown``
+    (both negative fractions). Rows before the first full window are NaN.
+    """
+    returns = pd.Series(returns)
+    engine = RollingMetrics(window, periods_per_year=periods_per_year, target=target)
+    rows = [engine.update(value) for value in returns.to_numpy(dtype=float)]
+    return pd.DataFrame(rows, index=returns.index, columns=COLUMNS, dtype=float)
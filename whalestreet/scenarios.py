@@ -0,0 +1,98 @@
+"""Stress scenarios applied to portfolio exposures.
+
+A scenario is a shock to every risk factor: the return of each equity
+segment over the stress period. A portfolio's stress return
+is its exposures times the shocks, so the returns of every portfolio under
+every scenario are one ``(portfolios, factors) @ (factors, scenarios)``
+product; thousands of portfolios against hundreds of scenarios take
+milliseconds.
+
+The library holds approximate peak-to-trough moves of Indian markets in
+past crises and hypothetical shocks, rate shocks included through their
+effect on equities; :func:`scale_scenarios` grows it into a family of
+milder and harsher variants, :func:`losing_scenarios` keeps the ones that
+cost a portfolio money and :func:`perturbed_exposures` draws client
+portfolios around a model allocation.
+"""
+import numpy as np
+import pandas as pd
+
+FACTORS = ("Large Cap", "Mid Cap", "Small Cap")
+
+# Approximate peak-to-trough returns in percent (Nifty 50, Nifty Midcap, Nifty Smallcap)
+HISTORICAL_SCENARIOS = {
+    "2008 Global Financial Crisis": (-60.0, -70.0, -75.0),
+    "2013 Taper Tantrum": (-13.0, -20.0, -25.0),
+    "2016 Demonetisation": (-10.0, -14.0, -17.0),
+    "2020 COVID Crash": (-38.0, -42.0, -47.0),
+    "2022 Rate Hikes": (-16.0, -21.0, -29.0),
+}
+HYPOTHETICAL_SCENARIOS = {
+    "Rates +200 bp": (-8.0, -11.0, -14.0),
+    "Rates +100 bp": (-4.0, -6.0, -8.0),
+    "Rates -100 bp": (4.0, 5.0, 6.0),
+    "Equity Crash -30%": (-30.0, -35.0, -40.0),
+    "Small Cap Liquidity Squeeze": (-5.0, -15.0, -30.0),
+}
+
+DEFAULT_SEVERITIES = np.linspace(0.25, 1.25, 11)
+DEFAULT_CONCENTRATION = 50.0
+
+
+def scenario_frame(scenarios=None):
+    """Shocks as fractions, one row per scenario and one column per factor.
+
+    Defaults to the historical and hypothetical libraries together.
+    """
+    scenarios = {**HISTORICAL_SCENARIOS, **HYPOTHETICAL_SCENARIOS} if scenarios is None else scenarios
+    frame = pd.DataFrame.from_dict(scenarios, orient="index", columns=list(FACTORS)) / 100
+    frame.index.name = "scenario"
+    return frame
+
+
+def scale_scenarios(shocks, severities=DEFAULT_SEVERITIES):
+    """Every scenario at every severity (1 is the scenario as given), indexed by ``(scenario, severity)``.
+
+    Scaled shocks are floored at -100%.
+    """
+    severities = np.asarray(severities, dtype=float)
+    values = np.maximum(severities[np.newaxis, :, np.newaxis] * shocks.to_numpy()[:, np.newaxis, :], -1.0)
+    index = pd.MultiIndex.from_product([shocks.index, severities], names=["scenario", "severity"])
+    return pd.DataFrame(values.reshape(-1, shocks.shape[1]), index=index, columns=shocks.columns)
+
+
+def losing_scenarios(shocks, exposures):
+    """The rows of ``shocks`` under which one portfolio's ``exposures`` lose money."""
+    return shocks[np.asarray(shocks, dtype=float) @ np.asarray(exposures, dtype=float) < 0]
+
+
+def perturbed_exposures(weights, n_portfolios, concentration=DEFAULT_CONCENTRATION, seed=42):
+    """``(n_portfolios, factors)`` long-only weights drawn around ``weights``.
+
+    Draws from a Dirichlet distribution with mean ``weights`` (normalized);
+    a higher ``concentration`` keeps the portfolios closer to it. Factors
+    with zero weight stay at zero.
+    """
+    weights = np.asarray(weights, dtype=float)
+    weights = weights / weights.sum()
+    held = weights > 0
+    rng = np.random.default_rng(seed)
+    exposures = np.zeros((n_portfolios, len(weights)))
+    exposures[:, held] = rng.dirichlet(concentration * weights[held], size=n_portfolios)
+    return exposures
+
+
+def stress_returns(exposures, shocks):
+    """Return of every portfolio under every scenario, shape ``(portfolios, scenarios)``.
+
+    ``exposures`` is a ``(portfolios, factors)`` array (or a single
+    portfolio) and ``shocks`` a ``(scenarios, factors)`` array or frame.
+    DataFrames are aligned on the factor columns and keep their labels.
+    """
+    if isinstance(shocks, pd.DataFrame) and isinstance(exposures, pd.DataFrame):
+        exposures = exposures[shocks.columns]
+    values = np.atleast_2d(np.asarray(exposures, dtype=float)) @ np.asarray(shocks, dtype=float).T
+    if isinstance(shocks, pd.DataFrame):
+        index = exposures.index if isinstance(exposures, pd.DataFrame) else None
+        return pd.DataFrame(values, index=index, columns=shocks.index)
+    return values
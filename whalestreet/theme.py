@@ -0,0 +1,138 @@
+"""Colors, chart theme and page-wide CSS shared by every dashboard page."""
+import streamlit as st
+
+# Define color palette
+PRIMARY_COLOR = "#2C3E50"  # Dark blue-grey
+ACCENT_COLOR = "#18BC9C"  # Mint green for highlights
+BACKGROUND_COLOR = "#FFFFFF"  # White background
+TEXT_COLOR = "#2C3E50"  # Dark blue-grey
+BORDER_COLOR = "#E0E0E0"  # Light grey for borders
+SHADOW_COLOR = "rgba(0, 0, 0, 0.1)"  # Light shadow
+
+# Everything cached figures depend on besides their data; changing it rebuilds them
+CHART_THEME = {
+    "base": st.get_option("theme.base"),
+    "primary": PRIMARY_COLOR,
+    "accent": ACCENT_COLOR,
+    "background": BACKGROUND_COLOR,
+    "text": TEXT_COLOR,
+}
+
+
+def apply_styles():
+    """Inject the dashboard CSS; called on every run before the page renders."""
+    # Light Theme Styling with Icons
+    st.markdown("""
+        <style>
+        body {
+            color: #333333;
+            background-color: #f7f7f7;
+            font-family: 'Helvetica Neue', sans-serif;
+        }
+        .main {
+            background-color: #ffffff;
+            padding: 20px;
+            border-radius: 10px;
+            box-shadow: 0px 0px 15px rgba(0, 0, 0, 0.1);
+        }
+        h1, h2, h3 {
+            color: #1a1a1a;
+            text-align: left;
+            font-family: 'Helvetica Neue', sans-serif;
+        }
+        .sidebar .sidebar-content {
+            background-color: #f0f0f0;
+            color: #333333;
+        }
+        .stButton>button {
+            background-color: #007acc;
+            color: white;
+            border-radius: 5px;
+        }
+        .footer {
+            text-align: center;
+            color: #666666;
+            font-size: 14px;
+            margin-top: 50px;
+        }
+        .metric {
+            text-align: center;
+            font-size: 18px;
+            margin: 10px;
+            padding: 15px;
+            background-color: #f0f0f0;
+            border-radius: 8px;
+            box-shadow: 0px 0px 10px rgba(0, 0, 0, 0.1);
+        }
+        .metric-value {
+            font-size: 24px;
+            color: #007acc;
+            font-weight: bold;
+        }
+        .metric-label {
+            font-size: 14px;
+            color: #666666;
+        }
+        .section-title {
+            display: flex;
+            align-items: center;
+            font-size: 24px;
+            margin-top: 30px;
+        }
+        .section-title img {
+            margin-right: 15px;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+    # Apply custom CSS for borders, shadows, and spacing
+    st.markdown(f"""
+        <style>
+            .reportview-container {{
+                background-color: {BACKGROUND_COLOR};
+                color: {TEXT_COLOR};
+                font-family: 'Arial', sans-serif;
+            }}
+            .sidebar .sidebar-content {{
+                background-color: {PRIMARY_COLOR};
+                color: white;
+            }}
+            h2, h3 {{
+                color: {PRIMARY_COLOR};
+                font-family: 'Arial', sans-serif;
+                font-weight: bold;
+            }}
+            .stButton button {{
+                background-color: {ACCENT_COLOR};
+                color: white;
+                border-radius: 5px;
+                border: none;
+                box-shadow: 2px 2px 5px {SHADOW_COLOR};
+            }}
+            .stButton button:hover {{
+                background-color: {PRIMARY_COLOR};
+            }}
+            .stMetric {{
+                background-color: {BACKGROUND_COLOR};
+                border: 1px solid {BORDER_COLOR};
+                padding: 10px;
+                border-radius: 10px;
+                box-shadow: 2px 2px 5px {SHADOW_COLOR};
+            }}
+            .stElement {{
+                margin-bottom: 20px;
+            }}
+            .section-header {{
+                background-color: {BACKGROUND_COLOR};
+                padding: 15px;
+                border-radius: 10px;
+                border: 1px solid {BORDER_COLOR};
+                box-shadow: 2px 2px 5px {SHADOW_COLOR};
+                color: {TEXT_COLOR};
+                margin-bottom: 20px;
+            }}
+            .section-header h3 {{
+                margin: 0;
+            }}
+        </style>
+    """, unsafe_allow_html=True)